@@ -4,6 +4,7 @@
 
 from django.apps import AppConfig
 from django.conf import settings
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.utils.translation import gettext_lazy as _
 
 # from django.utils.translation.trans_real import settings
@@ -38,3 +39,23 @@ class DjangoTagMeConfig(AppConfig):
                 "help_url": "",
                 "mgmt_url": "",
             }
+
+        from tag_me.db.models.fields import clear_tagged_field_cache
+        from tag_me.models import TaggedFieldModel
+
+        # Keep the form field's tagged field cache in step with the table.
+        # The dispatch_uids stop a repeated ready() connecting them twice.
+        post_save.connect(
+            clear_tagged_field_cache,
+            sender=TaggedFieldModel,
+            dispatch_uid="tag_me.clear_tagged_field_cache.post_save",
+        )
+        post_delete.connect(
+            clear_tagged_field_cache,
+            sender=TaggedFieldModel,
+            dispatch_uid="tag_me.clear_tagged_field_cache.post_delete",
+        )
+        post_migrate.connect(
+            clear_tagged_field_cache,
+            dispatch_uid="tag_me.clear_tagged_field_cache.post_migrate",
+        )
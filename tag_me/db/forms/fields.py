@@ -19,15 +19,7 @@ class TagMeCharField(CharField):
         "invalid": _("Please enter a valid tag/tags"),
     }
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.formatter = FieldTagListFormatter()
-
     def to_python(self, value):
         """Return FieldTagListFormatter(value).toCSV() string."""
-
-        self.formatter.clear()  # Ensure we start with an empty list
-        self.formatter.add_tags(value)
-        return self.formatter.toCSV(
-            include_trailing_comma=True,  # Ensures correct tag string parsing
-        )
+        # Stateless, so concurrent form cleans can't share tags.
+        return FieldTagListFormatter.normalize_csv(value)
@@ -1,9 +1,12 @@
+import functools
 from typing import Dict, Union
 
 from django.forms import Field
+from django.utils.functional import SimpleLazyObject
 
 from tag_me.db.forms.fields import TagMeCharField
 from tag_me.models import TaggedFieldModel, UserTag
+from tag_me.widgets import TagMeSelectMultipleWidget
 
 
 class TagMeModelFormMixin:
@@ -31,6 +34,13 @@ class TagMeModelFormMixin:
         self.model_name = kwargs.pop("model_name", None)
         super().__init__(*args, **kwargs)  # Call the original form's __init__
 
+        # Loaded when the first tagged field is rendered, so forms that are
+        # only validated don't query them.
+        tagged_fields = []
+        user_tags = SimpleLazyObject(
+            functools.partial(self._get_user_tags, tagged_fields)
+        )
+
         # Process fields
         for _, field in self.fields.items():
             # self.fields["field"].initial = obj._meta.get_field(field_name).verbose_name
@@ -41,4 +51,39 @@ class TagMeModelFormMixin:
                         "user": self.user,
                     }
                 )
+                # Other widgets, e.g. the admin's, would render it as HTML.
+                if isinstance(field.widget, TagMeSelectMultipleWidget):
+                    field.widget.attrs["user_tags"] = user_tags
+                    # Kept here as rendering pops it from the widget.
+                    if not field.widget.attrs.get("tag_choices"):
+                        tagged_fields.append(
+                            field.widget.attrs.get("tagged_field")
+                        )
                 # self.fields["field"].initial = field
+
+    def _get_user_tags(self, tagged_fields: list) -> dict:
+        """Returns the user's tags for `tagged_fields`, by tagged field id.
+
+        Fetched in one query, rather than one per tagged field as each widget
+        would.
+        """
+        if getattr(self.user, "pk", None) is None:
+            return {}
+
+        # The lazy tagged fields may be None or unsaved placeholders.
+        tagged_field_ids = {
+            getattr(tagged_field, "pk", None) for tagged_field in tagged_fields
+        }
+        tagged_field_ids.discard(None)
+        if not tagged_field_ids:
+            return {}
+
+        return {
+            user_tag.tagged_field_id: user_tag
+            for user_tag in UserTag.objects.filter(
+                user=self.user,
+                tagged_field_id__in=tagged_field_ids,
+            )
+            .only("id", "tags", "tagged_field_id")
+            .order_by()
+        }
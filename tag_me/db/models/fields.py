@@ -1,15 +1,19 @@
 """tag-me app custom model charfield."""
 
+import functools
 import logging
+import time
 
+from django.conf import settings
 from django.contrib.admin.widgets import AdminTextInputWidget
-from django.contrib.contenttypes.models import ContentType
 from django.core import validators
 from django.db import (
     OperationalError,
     ProgrammingError,
 )
 from django.db.models.fields import CharField
+from django.utils.functional import SimpleLazyObject
+from django.utils.translation import get_language
 
 from tag_me.db.forms.fields import TagMeCharField as TagMeCharField_FORM
 from tag_me.models import TaggedFieldModel
@@ -18,6 +22,148 @@ from tag_me.widgets import TagMeSelectMultipleWidget
 
 logger = logging.getLogger(__name__)
 
+# Tagged field rows looked up by `TagMeCharField.formfield`, keyed by
+# (model label_lower, field name), which matches the content type's
+# "app_label.model" so no ContentType lookup is needed.  Emptied whenever
+# TaggedFieldModel changes.
+_TAGGED_FIELD_CACHE: dict = {}
+# Key of the `time.monotonic()` at which the loaded rows are reloaded.
+_EXPIRES = object()
+# Seconds the rows are kept for.  The signals that empty the cache only
+# fire in this process, this picks up rows changed by another, e.g. the
+# tags command or migrate.
+_TAGGED_FIELD_CACHE_TIMEOUT = 60
+# Seconds before rows are reloaded after a field without one is looked up,
+# so a row added later, e.g. by the tags command, is found.
+_MISSING_TAGGED_FIELD_TIMEOUT = 10
+
+_ADMIN_WIDGETS_MODULE = AdminTextInputWidget.__module__
+
+
+def clear_tagged_field_cache(*args, **kwargs) -> None:
+    """Empties the tagged field cache, connected as a signal receiver."""
+    global _TAGGED_FIELD_CACHE
+    # Replaced rather than cleared, so a lookup in another thread never
+    # sees a half emptied cache.
+    _TAGGED_FIELD_CACHE = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_tag_string(value: str, parser: str = None) -> str:
+    """Cached string branch of `_normalize_tags_to_csv`.
+
+    `parser` is the configured tag parser, it is only part of the cache key.
+    """
+    return FieldTagListFormatter.normalize_csv(value)
+
+
+def _normalize_tags_to_csv(value) -> str:
+    """Returns tags as the sorted CSV string stored in the database.
+
+    The trailing comma ensures the tag string is parsed correctly when read
+    back.  String values, which every row read from the database is, are
+    cached.
+    """
+    if isinstance(value, str):
+        parser = getattr(settings, "TAGME_GET_TAGS_FROM_STRING", None)
+        # Values written by `get_prep_value` don't need parsing again,
+        # unless a custom parser could read them differently.
+        if parser is None and _is_normalized_tag_string(value):
+            return value
+        return _normalize_tag_string(value, parser)
+    return FieldTagListFormatter.normalize_csv(value)
+
+
+def _is_admin_widget(widget) -> bool:
+    """Returns True if `widget` is a Django admin widget class or instance.
+
+    A widget given as a string is matched against the admin widgets module
+    path.
+    """
+    if isinstance(widget, str):
+        return _ADMIN_WIDGETS_MODULE in widget
+    if not isinstance(widget, type):
+        widget = type(widget)
+    return widget.__module__ == _ADMIN_WIDGETS_MODULE
+
+
+@functools.lru_cache(maxsize=None)
+def _log_invalid_choices_type(choices_type: type) -> None:
+    """Logs an invalid tag choices type, once for each type."""
+    logger.error(
+        "Tag choices must be of type <list> or <model.TextChoices> not %s",
+        choices_type,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _log_tagged_field_table_error(error: str) -> None:
+    """Logs a failed tagged field lookup, once for each error."""
+    logger.error(
+        "%s: Please check you have run migrations, if so has "
+        "the TaggedFieldModel table been deleted from your "
+        "data base?\nWe have added an UNSAVED Tagged Field "
+        "type as a placeholder for you django-tag-me display."
+        "\nPlease resolve this error before using this "
+        "feature as unintended consequences may occur!",
+        error,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _choices_to_tags(choices: tuple) -> tuple:
+    """Returns field choices as tags, shared by fields with equal choices."""
+    return tuple(FieldTagListFormatter(list(choices)).toList())
+
+
+def _is_normalized_tag_string(value: str) -> bool:
+    """Returns True if `value` is already in the form `get_prep_value` stores.
+
+    That is sorted, unique, printable tags joined by ", " with a trailing
+    comma, which the default parser would return unchanged.
+    """
+    if value == "":
+        return True
+    if not value.endswith(",") or '"' in value or not value.isprintable():
+        return False
+
+    previous = None
+    for tag in value[:-1].split(", "):
+        if (
+            not tag
+            or "," in tag
+            or tag != tag.strip()
+            or (previous is not None and tag <= previous)
+            or not FieldTagListFormatter.is_valid_tag(tag)
+        ):
+            return False
+        previous = tag
+    return True
+
+
+def _prime_tagged_field_cache() -> dict:
+    """Loads every tagged field row into a new cache with a single query.
+
+    The cache is built and then swapped in, so lookups in other threads see
+    either all of the old rows or all of the new ones.  Returns the cache.
+    """
+    global _TAGGED_FIELD_CACHE
+    # The widget only uses the row to find the user's tags, so just load the
+    # columns needed for the cache key.
+    tagged_fields = TaggedFieldModel.objects.select_related("content").only(
+        "content",
+        "field_name",
+        "content__app_label",
+        "content__model",
+    )
+    cache = {_EXPIRES: time.monotonic() + _TAGGED_FIELD_CACHE_TIMEOUT}
+    for tagged_field in tagged_fields:
+        content = tagged_field.content
+        model_label = f"{content.app_label}.{content.model}"
+        cache[(model_label, tagged_field.field_name)] = tagged_field
+    _TAGGED_FIELD_CACHE = cache
+    return cache
+
 
 class TagMeCharField(CharField):
     """A custom Django model field for storing and managing tags.
@@ -55,30 +201,37 @@ class TagMeCharField(CharField):
         self.synchronise = synchronise
         self.db_collation = db_collation
         self.validators.append(validators.MaxLengthValidator(self.max_length))
-        self.formatter = FieldTagListFormatter()
         # Used to pass choices as a list to widget attrs.
         self._tag_choices: list = []
+        # Resolved verbose names, see `_get_verbose_names`.
+        self._verbose_names: dict = {}
         self.tag_type: str = "user"
         if self.choices:
             tag_choices_list = []
             # Convert choices into tags.
             match self.choices:
-                case list() if all(
-                    isinstance(x, tuple) and len(x) == 2 for x in self.choices
-                ):
-                    """If we have Django choices tuples, extract the first element."""
-                    for label, _ in self.choices:
-                        tag_choices_list.append(str(label))
-                case list():  # More general case comes after
-                    """If we have a list just turn into tags."""
-                    tag_choices_list.extend(self.choices)
+                case list():
+                    # Single pass, extract the first element of Django choices
+                    # tuples until anything else is found.
+                    for choice in self.choices:
+                        if not (
+                            isinstance(choice, tuple) and len(choice) == 2
+                        ):
+                            """If we have a list just turn into tags."""
+                            tag_choices_list = list(self.choices)
+                            break
+                        tag_choices_list.append(str(choice[0]))
                 case _:
-                    msg = f"Tag choices must be of type <list> or <model.TextChoices> not {type(self.choices)}"
-                    logger.error(msg=msg)
-
-            self.formatter.clear()
-            self.formatter.add_tags(tag_choices_list)
-            self._tag_choices = self.formatter.toList()
+                    _log_invalid_choices_type(type(self.choices))
+
+            try:
+                self._tag_choices = list(
+                    _choices_to_tags(tuple(tag_choices_list))
+                )
+            except TypeError:  # Unhashable choices can't be cached.
+                self._tag_choices = FieldTagListFormatter(
+                    tag_choices_list
+                ).toList()
             self.tag_type = "system"
             self.choices = None  # Disable Django choices machinery.
 
@@ -94,12 +247,7 @@ class TagMeCharField(CharField):
 
         :return: A FieldTagListFormatter instance containing the parsed tags.
         """
-        self.formatter.clear()  # Ensure we start with an empty list
-        self.formatter.add_tags(value)
-
-        return self.formatter.toCSV(
-            include_trailing_comma=True,  # Ensures correct tag string parsing
-        )
+        return _normalize_tags_to_csv(value)
 
     def get_prep_value(self, value):
         """
@@ -111,12 +259,7 @@ class TagMeCharField(CharField):
         :return: A CSV-formatted string representing the tags, ready for
                         database storage.
         """
-        self.formatter.clear()  # Ensure we start with an empty list
-        self.formatter.add_tags(value)
-
-        return self.formatter.toCSV(
-            include_trailing_comma=True,  # Ensures correct tag string parsing
-        )
+        return _normalize_tags_to_csv(value)
 
     def to_python(self, value):
         """
@@ -130,12 +273,59 @@ class TagMeCharField(CharField):
 
         :return string: A FieldTagListFormatter.toCSV() formatted string.
         """
-        self.formatter.clear()  # Ensure we start with an empty list
-        self.formatter.add_tags(value)
+        return _normalize_tags_to_csv(value)
 
-        return self.formatter.toCSV(
-            include_trailing_comma=True,  # Ensures correct tag string parsing
-        )
+    def _get_verbose_names(self) -> tuple:
+        """Returns the model and field verbose names as strings.
+
+        Verbose names are usually lazy translations, they are resolved once
+        per active language.  The model is part of the key as copies of this
+        field on other models share the cache.
+        """
+        key = (get_language(), self.model._meta.label)
+        verbose_names = self._verbose_names.get(key)
+        if verbose_names is None:
+            verbose_names = (
+                str(self.model._meta.verbose_name),
+                None if self.verbose_name is None else str(self.verbose_name),
+            )
+            self._verbose_names[key] = verbose_names
+        return verbose_names
+
+    def _get_tagged_field(self) -> TaggedFieldModel | None:
+        """Returns this field's `TaggedFieldModel` row from the cache.
+
+        The widget resolves this lazily, so forms that are never rendered
+        don't look it up.
+        """
+        # During initial migrations, database tables may not exist yet.
+        # This try-except block gracefully handles database queries before the schema
+        # is fully set up, allowing migrations to proceed by providing a temporary
+        # placeholder TaggedFieldModel instance when database access fails.
+        # We catch both OperationalError (typically raised by SQLite) and
+        # ProgrammingError (typically raised by PostgreSQL) to handle different
+        # database backends gracefully.
+        now = time.monotonic()
+        # Read once, the cache may be replaced by another thread meanwhile.
+        cache = _TAGGED_FIELD_CACHE
+        if cache.get(_EXPIRES, 0) <= now:
+            try:
+                cache = _prime_tagged_field_cache()
+            except (OperationalError, ProgrammingError) as e:
+                _log_tagged_field_table_error(str(e))
+                # Not cached, so the rows are loaded once the table exists.
+                return TaggedFieldModel()
+
+        # Content types are recorded against the concrete model.
+        key = (self.model._meta.concrete_model._meta.label_lower, self.name)
+        tagged_field = cache.get(key)
+        if tagged_field is None:
+            # Reload soon, another process may be about to add the row.
+            expires = now + _MISSING_TAGGED_FIELD_TIMEOUT
+            if cache[_EXPIRES] > expires:
+                cache[_EXPIRES] = expires
+
+        return tagged_field
 
     def formfield(self, **kwargs):
         """Overrides the default form field generation for this model field.
@@ -164,29 +354,13 @@ class TagMeCharField(CharField):
 
         # Added for edge cases when running tests.
         if hasattr(self, "model"):
-            model_verbose_name = self.model._meta.verbose_name
+            model_verbose_name, field_verbose_name = self._get_verbose_names()
         else:
             model_verbose_name = "** No Model **"
-
-        # During initial migrations, database tables may not exist yet.
-        # This try-except block gracefully handles database queries before the schema
-        # is fully set up, allowing migrations to proceed by providing a temporary
-        # placeholder TaggedFieldModel instance when database access fails.
-        # We catch both OperationalError (typically raised by SQLite) and
-        # ProgrammingError (typically raised by PostgreSQL) to handle different
-        # database backends gracefully.
-        try:
-            tagged_field = TaggedFieldModel.objects.filter(
-                content=ContentType.objects.get_for_model(self.model),
-                field_name=self.name,
-            ).first()
-        except (OperationalError, ProgrammingError) as e:
-            msg = f"{str(e)}: Please check you have run migrations, if so has the TaggedFieldModel table been deleted from your data base?\nWe have added an UNSAVED Tagged Field type as a placeholder for you django-tag-me display.\nPlease resolve this error before using this feature as unintended consequences may occur!"
-            tagged_field = TaggedFieldModel()
-            logger.error(msg)
+            field_verbose_name = self.verbose_name
 
         # Conditional widget configuration
-        if "django.contrib.admin.widgets" in str(widget):
+        if _is_admin_widget(widget):
             # Admin-specific widget setup
             defaults = {
                 "max_length": self.max_length,
@@ -206,10 +380,12 @@ class TagMeCharField(CharField):
                 "widget": TagMeSelectMultipleWidget(
                     attrs={
                         "multiple": self.multiple,
-                        "tagged_field": tagged_field,
+                        "tagged_field": SimpleLazyObject(
+                            self._get_tagged_field
+                        ),
                         "model_verbose_name": model_verbose_name,
                         "field_name": self.name,
-                        "field_verbose_name": self.verbose_name,
+                        "field_verbose_name": field_verbose_name,
                         "tag_choices": self._tag_choices,
                     },
                 ),
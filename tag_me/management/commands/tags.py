@@ -5,6 +5,7 @@ import logging
 from django.conf import settings
 from django.core.management.base import BaseCommand, LabelCommand
 
+from tag_me.models import TagMeSynchronise
 from tag_me.utils.tag_mgmt_system import (
     update_models_with_tagged_fields_table,
     generate_user_tag_table_records,
@@ -35,7 +36,7 @@ class Command(BaseCommand):
         try:
             self.stdout.write("    Updating Tagged Models Table.")
 
-            update_models_with_tagged_fields_table()
+            sync = update_models_with_tagged_fields_table()
 
             generate_user_tag_table_records()
 
@@ -45,9 +46,12 @@ class Command(BaseCommand):
                     " and Synchronised Fields updated."
                 )
             )
-            from tag_me.models import TagMeSynchronise
-
-            sync, _ = TagMeSynchronise.objects.get_or_create(name="default")
+            # Reuse the sync config the update saved, unless there were no
+            # tagged fields to update.
+            if sync is None:
+                sync, _ = TagMeSynchronise.objects.get_or_create(
+                    name="default"
+                )
             sync.check_field_sync_list_lengths()
 
         except Exception as e:
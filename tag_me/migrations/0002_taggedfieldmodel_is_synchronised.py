@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tag_me", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taggedfieldmodel",
+            name="is_synchronised",
+            field=models.BooleanField(
+                db_index=True,
+                default=False,
+                editable=False,
+                help_text="Tags on this field are synchronised with other content types.",
+                verbose_name="Synchronised",
+            ),
+        ),
+    ]
@@ -0,0 +1,125 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:27
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def _split_tags(tag_string):
+    """Returns the stripped, non blank tags in a CSV tag string."""
+    return {
+        tag.strip() for tag in (tag_string or "").split(",") if tag.strip()
+    }
+
+
+def _join_tags(tags):
+    """Returns tags in the sorted "a, b," form the tag fields store."""
+    return ", ".join(sorted(tags)) + "," if tags else ""
+
+
+def _merge_tags(existing, added, max_length):
+    """Merge `added` CSV tags into `existing`, within `max_length`.
+
+    The existing tags already fit and are always kept. Added tags are taken
+    in sorted order while the result still fits, the rest are returned so
+    they can be reported rather than silently lost.
+    """
+    tags = _split_tags(existing)
+    dropped = []
+    for tag in sorted(_split_tags(added) - tags):
+        if len(_join_tags(tags | {tag})) <= max_length:
+            tags.add(tag)
+        else:
+            dropped.append(tag)
+    return _join_tags(tags), dropped
+
+
+def remove_duplicate_tagged_fields(apps, schema_editor):
+    """Keep the oldest row for each content type and field name.
+
+    Earlier versions added a new row whenever a verbose name changed, those
+    rows would break the new unique constraint.
+
+    Deleting a duplicate would cascade to the user tags pointing at it, so
+    they are moved to the kept row first. Where the user already has tags
+    on the kept row the two are merged, tags that would take the merged row
+    past its max length are logged and dropped.
+    """
+    TaggedFieldModel = apps.get_model("tag_me", "TaggedFieldModel")
+    UserTag = apps.get_model("tag_me", "UserTag")
+    db_alias = schema_editor.connection.alias
+
+    kept = {}
+    duplicates = {}
+    for pk, content_id, field_name in (
+        TaggedFieldModel.objects.using(db_alias)
+        .order_by("pk")
+        .values_list("pk", "content_id", "field_name")
+    ):
+        key = (content_id, field_name)
+        if key in kept:
+            duplicates[pk] = kept[key]
+        else:
+            kept[key] = pk
+
+    if not duplicates:
+        return
+
+    max_length = UserTag._meta.get_field("tags").max_length
+    user_tags = UserTag.objects.using(db_alias)
+    moved = user_tags.filter(tagged_field_id__in=duplicates).order_by("pk")
+    for user_tag in moved:
+        kept_id = duplicates[user_tag.tagged_field_id]
+        existing = None
+        if user_tag.user_id is not None:
+            existing = user_tags.filter(
+                user_id=user_tag.user_id,
+                tagged_field_id=kept_id,
+            ).first()
+        if existing is None:
+            user_tag.tagged_field_id = kept_id
+            user_tag.save(update_fields=["tagged_field"])
+        else:
+            existing.tags, dropped = _merge_tags(
+                existing.tags, user_tag.tags, max_length
+            )
+            existing.save(update_fields=["tags"])
+            if dropped:
+                logger.warning(
+                    "User tag %s is full, tags not merged from user tag "
+                    "%s: %s",
+                    existing.pk,
+                    user_tag.pk,
+                    ", ".join(dropped),
+                )
+            user_tag.delete()
+
+    TaggedFieldModel.objects.using(db_alias).filter(pk__in=duplicates).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tag_me", "0002_taggedfieldmodel_is_synchronised"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_tagged_fields,
+            migrations.RunPython.noop,
+        ),
+        migrations.RemoveConstraint(
+            model_name="taggedfieldmodel",
+            name="unique_tagged_field_model",
+        ),
+        migrations.AddConstraint(
+            model_name="taggedfieldmodel",
+            constraint=models.UniqueConstraint(
+                fields=("content", "field_name"),
+                name="unique_tagged_field_content_field",
+            ),
+        ),
+    ]
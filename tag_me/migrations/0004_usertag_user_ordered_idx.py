@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tag_me", "0003_taggedfieldmodel_unique_content_field"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usertag",
+            index=models.Index(
+                fields=["user", "model_verbose_name", "field_name", "tags"],
+                name="usertag_user_ordered_idx",
+            ),
+        ),
+    ]
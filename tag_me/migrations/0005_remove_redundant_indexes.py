@@ -0,0 +1,45 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("tag_me", "0004_usertag_user_ordered_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="usertag",
+            name="tag_me_user_user_id_c18274_idx",
+        ),
+        migrations.AlterField(
+            model_name="taggedfieldmodel",
+            name="content",
+            field=models.ForeignKey(
+                db_index=False,
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="contenttypes.contenttype",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usertag",
+            name="user",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="user_tags",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="User",
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.1.15 on 2026-10-18 04:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tag_me", "0005_remove_redundant_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="usertag",
+            name="field_name",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=128,
+                null=True,
+                verbose_name="Field name",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usertag",
+            name="field_verbose_name",
+            field=models.CharField(
+                blank=True,
+                default=None,
+                editable=False,
+                max_length=128,
+                null=True,
+                verbose_name="Field verbose",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usertag",
+            name="model_name",
+            field=models.CharField(
+                blank=True,
+                default=None,
+                editable=False,
+                max_length=128,
+                null=True,
+                verbose_name="Model name",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="usertag",
+            name="model_verbose_name",
+            field=models.CharField(
+                blank=True,
+                default=None,
+                editable=False,
+                max_length=128,
+                null=True,
+                verbose_name="Model verbose",
+            ),
+        ),
+    ]
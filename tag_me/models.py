@@ -1,17 +1,26 @@
 """tags Models file."""
 
-import copy
+import collections
+import functools
 import logging
+import string
+import unicodedata
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.db import IntegrityError, models, router, transaction
+from django.db import models, router, transaction
 from django.utils.crypto import get_random_string
 from django.utils.text import slugify
 from django.utils.translation import pgettext_lazy as _
 
 User = settings.AUTH_USER_MODEL
 
+# Characters and length of the random suffix of a tag slug.
+_SLUG_ALPHABET = string.ascii_lowercase + string.digits
+_SLUG_SUFFIX_LENGTH = 16
+# Marks tags that haven't been loaded or saved.
+_UNSET = object()
+
 try:
     """Ported from django-taggit
     https://github.com/jazzband/django-taggit/tree/master
@@ -23,6 +32,16 @@ except ImportError:
         return tag
 
 
+@functools.lru_cache(maxsize=1024)
+def _ascii_tag(tag: str) -> str:
+    """Returns `tag` folded to ASCII for its slug.
+
+    Composed and decomposed forms of a character are folded alike, and the
+    result is cached as the same tags are slugified repeatedly.
+    """
+    return unidecode(unicodedata.normalize("NFKC", tag))
+
+
 class TagBase(models.Model):
     """Base class for Tag models.
 
@@ -90,45 +109,54 @@ class TagBase(models.Model):
     def model_class_verbose_name(self):
         return self._meta.verbose_name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored tags, so a save can tell if they changed.
+        if "tags" in instance.__dict__:
+            instance._stored_tags = instance.tags
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None or "tags" in fields:
+            self._stored_tags = self.tags
+
+    def _tags_changed(self, update_fields=None) -> bool:
+        """Returns False if the tags match those last loaded or saved.
+
+        Also False when `update_fields` is given without "tags", as the
+        tags won't be written.
+        """
+        if update_fields is not None and "tags" not in update_fields:
+            return False
+        return getattr(self, "_stored_tags", _UNSET) != self.tags
+
     def save(self, *args, **kwargs):
         """Ported from django-taggit
         https://github.com/jazzband/django-taggit/tree/master
         """
         if self._state.adding and not self.slug:
+            # The random suffix makes a slug collision vanishingly unlikely,
+            # so the save isn't wrapped in a retry.
             self.slug = self.slugify(self.tags)
-            using = kwargs.get("using") or router.db_for_write(
-                type(self), instance=self
-            )
-            # Make sure we write to the same db for all attempted writes,
-            # with a multi-master setup, theoretically we could try to
-            # write and rollback on different DBs
-            kwargs["using"] = using
-            # Be opportunistic and try to save the tag, this should work for
-            # most cases ;)
-            try:
-                with transaction.atomic(using=using):
-                    res = super().save(*args, **kwargs)
-                return res
-            except IntegrityError:
-                pass
-        else:
-            return super().save(*args, **kwargs)
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "tags" in update_fields:
+            self._stored_tags = self.tags
 
-    @staticmethod
-    def slugify(tag: str = "") -> str:
+    @classmethod
+    def slugify(cls, tag: str = "") -> str:
+        suffix = get_random_string(_SLUG_SUFFIX_LENGTH, _SLUG_ALPHABET)
         if getattr(settings, "TAGS_STRIP_UNICODE_WHEN_SLUGIFYING", False):
-            slug = slugify(
-                unidecode(tag)
-                + "-"
-                + get_random_string(8, f"abcdqrwxyz{tag}0123456789")
-            )
+            slug = slugify(_ascii_tag(tag))
         else:
-            slug = slugify(
-                tag + "-" + get_random_string(8, f"abcdqrwxyz{tag}0123456789"),
-                allow_unicode=True,
-            )
+            slug = slugify(tag, allow_unicode=True)
 
-        return slug
+        # Tags may be longer than the slug column, leave room for the suffix.
+        max_length = cls._meta.get_field("slug").max_length
+        slug = slug[: max_length - _SLUG_SUFFIX_LENGTH - 1].rstrip("-_")
+        return f"{slug}-{suffix}" if slug else suffix
 
 
 class TagMeSynchronise(models.Model):
@@ -178,7 +206,7 @@ class TagMeSynchronise(models.Model):
 
     def _get_field_name_models_to_sync(self, field: str = None) -> bool:
         """"""
-        if field in self.synchronise.keys():
+        if field in self.synchronise:
             return self.synchronise.get(field)
 
     def _add_model_to_sync_list(
@@ -204,41 +232,56 @@ class TagMeSynchronise(models.Model):
         removal from the synchronization configuration.
         * **Lists with one entry:** Warns about potentially incomplete
             configurations.
-        * **Lists with two or more entries:** Provides information depending
-            on the length, considering a two-item synchronization list as the
-            expected minimum.
+        * **Lists with two or more entries:** Provides information,
+            considering a two-item synchronization list as the expected
+            minimum.
+
+        Fields are grouped by these checks and each group is logged once.
         """
         logger = logging.getLogger(__name__)
-        if self.synchronise.items():
-            for k, v in self.synchronise.items():
-                match len(v):
-                    case 0:
-                        logger.warning(
-                            "Field <%s> has no content id's listed that require synchronising.\nPlease consider removing this key from the sync list.",
-                            k,
-                        )
-                    case 1:
-                        logger.warning(
-                            "Field <%s> only has 1 element, content id is %s\nHave you forgotten to add synchronise=True to another model <%s> field?",
-                            k,
-                            v,
-                            k,
-                        )
-                    case 2:
-                        logger.info(
-                            "Your field <%s> sync list has 2 required minumum elements with content id's %s ",
-                            k,
-                            v,
-                        )
-                    case _:
-                        logger.info(
-                            "Your field <%s> sync list has more than the 2 required minumum elements with content id's %s ",
-                            k,
-                            v,
-                        )
-
-        else:
+        if not self.synchronise:
             logger.info("You have no field tags listed that require synchronising")
+            return
+
+        empty, single, synchronised = [], {}, {}
+        for k, v in self.synchronise.items():
+            match len(v):
+                case 0:
+                    empty.append(k)
+                case 1:
+                    single[k] = v
+                case _:
+                    synchronised[k] = v
+
+        if empty:
+            logger.warning(
+                "Fields %s have no content id's listed that require synchronising.\nPlease consider removing these keys from the sync list.",
+                empty,
+            )
+        if single:
+            logger.warning(
+                "Fields with only 1 element, and their content id's %s\nHave you forgotten to add synchronise=True to another model field with the same name?",
+                single,
+            )
+        if synchronised:
+            logger.info(
+                "Your fields sync lists have the 2 required minimum elements, with content id's %s ",
+                synchronised,
+            )
+
+
+def _get_sync_config(name: str = "default", using: str = None) -> dict:
+    """Returns the `synchronise` map for `name`, or an empty dict.
+
+    Read from the database each time, the tags command may update it from
+    another process.
+    """
+    return (
+        TagMeSynchronise.objects.using(using)
+        .filter(name=name)
+        .values_list("synchronise", flat=True)
+        .first()
+    ) or {}
 
 
 class TaggedFieldModel(models.Model):
@@ -262,15 +305,14 @@ class TaggedFieldModel(models.Model):
             "Tagged Field Models",
         )
         constraints = [
+            # Also serves as the index for looking a field up by its model's
+            # content type and field name.
             models.UniqueConstraint(
                 fields=[
                     "content",
-                    "model_name",
-                    "model_verbose_name",
                     "field_name",
-                    "field_verbose_name",
                 ],
-                name="unique_tagged_field_model",
+                name="unique_tagged_field_content_field",
             ),
         ]
 
@@ -278,6 +320,7 @@ class TaggedFieldModel(models.Model):
         ContentType,
         on_delete=models.CASCADE,
         editable=False,
+        db_index=False,  # Covered by the unique constraint in Meta.
     )
 
     model_name = models.CharField(
@@ -326,13 +369,184 @@ class TaggedFieldModel(models.Model):
             "These are generated for each new user to get them started.",
         ),
     )
+    is_synchronised = models.BooleanField(
+        verbose_name=_(
+            "Verbose name",
+            "Synchronised",
+        ),
+        default=False,
+        db_index=True,
+        editable=False,
+        help_text=_(
+            "Help",
+            "Tags on this field are synchronised with other content types.",
+        ),
+    )
 
     def __str__(self):
         return f"{self.model_verbose_name} - {self.field_verbose_name}"
 
 
-# A store for synchronised tags, that are yet to be saved
-add_synced_user_tags_list = []
+class UserTagManager(models.Manager):
+    """Manager for `UserTag` with tag synchronising helpers."""
+
+    def propagate_tag(
+        self,
+        user_id: int = None,
+        field_name: str = None,
+        tags: str = None,
+        content_ids: list = None,
+        sync_name: str = "default",
+    ) -> int:
+        """
+        Sets a users tags on a synchronised field with a single UPDATE.
+
+        The update does not call `UserTag.save`, so it never triggers a
+        further round of synchronising.
+
+        :param user_id: The id of the user who owns the tags.
+        :param field_name: The synchronised field name.
+        :param tags: The tags to set.
+        :param content_ids: The content type ids to set the tags on.
+                            Defaults to every content type synchronised
+                            for `field_name` in `sync_name`.
+        :param sync_name: The name of the syncronisation key to use.
+                          Defaults to default
+        :return: The number of user tags updated.
+        """
+        if content_ids is None:
+            synchronise = _get_sync_config(sync_name, using=self._db)
+            if field_name not in synchronise:
+                return 0
+            content_ids = synchronise[field_name]
+
+        return self.filter(
+            user_id=user_id,
+            tagged_field__field_name=field_name,
+            tagged_field__content_id__in=content_ids,
+        ).update(tags=tags)
+
+    def bulk_upsert(
+        self,
+        rows: list = None,
+        sync: bool = True,
+        batch_size: int = 1000,
+    ) -> tuple[int, int]:
+        """
+        Creates or updates many user tags without calling `UserTag.save`.
+
+        Tagged fields and existing user tags are each fetched with one
+        query, then the rows are written with `bulk_create` and
+        `bulk_update` in a single transaction.  Rows for a field without
+        a `TaggedFieldModel` are skipped.
+
+        :param rows: Dicts with `user_id`, `content_id`, `field_name` and
+                     `tags` keys.  `content_id` is the field's content
+                     type id.
+        :param sync: If True, tags on synchronised fields are propagated
+                     once the transaction commits, as `UserTag.save` does.
+                     Content types given tags in `rows` keep them, the
+                     others get the user's last changed tags for the field.
+        :param batch_size: The batch size for the bulk queries.
+        :return: The number of user tags created and updated.
+        """
+        if not rows:
+            return 0, 0
+
+        using = router.db_for_write(self.model)
+        tagged_fields = {
+            (tagged_field.content_id, tagged_field.field_name): tagged_field
+            for tagged_field in TaggedFieldModel.objects.using(using).filter(
+                content_id__in={row["content_id"] for row in rows},
+                field_name__in={row["field_name"] for row in rows},
+            )
+        }
+        # The last row wins if a user and field are repeated.
+        pending = {}
+        for row in rows:
+            tagged_field = tagged_fields.get(
+                (row["content_id"], row["field_name"])
+            )
+            if tagged_field is not None:
+                pending[(row["user_id"], tagged_field.id)] = (
+                    tagged_field,
+                    row["tags"],
+                )
+        if not pending:
+            return 0, 0
+
+        existing = {
+            (user_tag.user_id, user_tag.tagged_field_id): user_tag
+            for user_tag in self.using(using).filter(
+                user_id__in={user_id for user_id, _ in pending},
+                tagged_field_id__in={
+                    tagged_field_id for _, tagged_field_id in pending
+                },
+            )
+        }
+
+        to_create = []
+        to_update = []
+        # Changed tags by user and synchronised field name, and the content
+        # types given tags in this call, which aren't propagated over.
+        synchronised = {}
+        written = collections.defaultdict(set)
+        for key, (tagged_field, tags) in pending.items():
+            user_id, _ = key
+            sync_key = (user_id, tagged_field.field_name)
+            written[sync_key].add(tagged_field.content_id)
+            user_tag = existing.get(key)
+            if user_tag is None:
+                to_create.append(
+                    self.model(
+                        user_id=user_id,
+                        tagged_field=tagged_field,
+                        model_name=tagged_field.model_name,
+                        model_verbose_name=tagged_field.model_verbose_name,
+                        field_name=tagged_field.field_name,
+                        field_verbose_name=tagged_field.field_verbose_name,
+                        ui_display_name=tagged_field.field_verbose_name,
+                        slug=self.model.slugify(tag=tags or ""),
+                        tags=tags,
+                    )
+                )
+            elif user_tag.tags != tags:
+                user_tag.tags = tags
+                to_update.append(user_tag)
+            else:
+                continue
+            if tagged_field.is_synchronised:
+                # The last changed row wins for a user's synchronised field.
+                synchronised[sync_key] = tags
+
+        with transaction.atomic(using=using):
+            self.using(using).bulk_create(to_create, batch_size=batch_size)
+            self.using(using).bulk_update(
+                to_update, ["tags"], batch_size=batch_size
+            )
+            if sync and synchronised:
+                synchronise = _get_sync_config(using=using)
+                for sync_key, tags in synchronised.items():
+                    user_id, field_name = sync_key
+                    content_ids = [
+                        content_id
+                        for content_id in synchronise.get(field_name, [])
+                        if content_id not in written[sync_key]
+                    ]
+                    if not content_ids:
+                        continue
+                    transaction.on_commit(
+                        functools.partial(
+                            self.db_manager(using).propagate_tag,
+                            user_id=user_id,
+                            field_name=field_name,
+                            tags=tags,
+                            content_ids=content_ids,
+                        ),
+                        using=using,
+                    )
+
+        return len(to_create), len(to_update)
 
 
 class UserTag(TagBase):
@@ -380,8 +594,6 @@ class UserTag(TagBase):
 
     """
 
-    # objects = UserTagsManager()
-
     class Meta:
         verbose_name = _(
             "Verbose name",
@@ -391,13 +603,20 @@ class UserTag(TagBase):
             "Verbose name",
             "User Tags",
         )
+        # The unique constraint below indexes lookups by user and tagged
+        # field, and leads with `user` as does this index, so neither needs
+        # a separate index of its own.
         indexes = [
+            # Covers a users tags filtered by model and field, returned in
+            # `ordering` without a separate sort.
             models.Index(
                 fields=[
                     "user",
-                    "tagged_field",
+                    "model_verbose_name",
+                    "field_name",
                     "tags",
-                ]
+                ],
+                name="usertag_user_ordered_idx",
             ),
         ]
         constraints = [
@@ -415,7 +634,7 @@ class UserTag(TagBase):
             "tags",
         ]
 
-    objects = models.Manager()
+    objects = UserTagManager()
     tagged_field = models.ForeignKey(
         TaggedFieldModel,
         blank=True,
@@ -434,6 +653,7 @@ class UserTag(TagBase):
         blank=True,
         null=True,
         editable=False,
+        db_index=False,  # Covered by the indexes in Meta.
         related_name="user_tags",
         on_delete=models.CASCADE,
         verbose_name=_(
@@ -444,7 +664,7 @@ class UserTag(TagBase):
     model_verbose_name = models.CharField(
         blank=True,
         null=True,
-        max_length=255,
+        max_length=128,
         editable=False,
         verbose_name=_(
             "Verbose name",
@@ -457,7 +677,7 @@ class UserTag(TagBase):
         blank=True,
         null=True,
         editable=False,
-        max_length=255,
+        max_length=128,
         verbose_name=_(
             "Verbose name",
             "Model name",
@@ -479,7 +699,7 @@ class UserTag(TagBase):
         blank=True,
         null=True,
         editable=False,
-        max_length=255,
+        max_length=128,
         verbose_name=_(
             "Verbose name",
             "Field name",
@@ -490,7 +710,7 @@ class UserTag(TagBase):
         blank=True,
         null=True,
         editable=False,
-        max_length=255,
+        max_length=128,
         verbose_name=_(
             "Verbose name",
             "Field verbose",
@@ -537,6 +757,7 @@ class UserTag(TagBase):
 
         This method allows you to control whether related tags from synchronised
         content types will also be updated when the model saves.
+        Related tags are updated once the current transaction commits.
         :param name: The name of the syncronisation key to use.
                                 Defaults to default
         :param sync_tags_save: If True, tags on related content types configured
@@ -545,42 +766,51 @@ class UserTag(TagBase):
         :param kwargs: Additional keyword arguments passed to the superclass's save method.
 
         """
+        tags_changed = self._tags_changed(kwargs.get("update_fields"))
+        super().save(*args, **kwargs)
+
         # We don't need to gather synchronising information if the save is
         # for synchronising tags.  The information has already been collected
-        if not sync_tags_save:
-            sync = TagMeSynchronise.objects.get(
-                name=name,
+        if (
+            sync_tags_save
+            or self.tagged_field_id is None
+            or not self.field_name
+        ):
+            return
+        # The other content types already have these tags.
+        if not tags_changed:
+            return
+        # Most fields are not synchronised, the tags command keeps this flag
+        # up to date so they skip the sync config lookup.
+        if not self.tagged_field.is_synchronised:
+            return
+
+        synchronise = _get_sync_config(name)
+        # Check if tags should be synced for a specific field
+        if self.field_name in synchronise:
+            # Get other objects with this tag ( then exclude the current one)
+            content_ids = [
+                content_id
+                for content_id in synchronise[self.field_name]
+                if content_id != self.tagged_field.content_id
+            ]
+            # Nothing else is synchronised with this field.
+            if not content_ids:
+                return
+
+            # Propagate once this save is committed, so the fan-out to
+            # the other content types stays off the request path.
+            transaction.on_commit(
+                functools.partial(
+                    # Written to the database this row was saved to.
+                    UserTag.objects.db_manager(self._state.db).propagate_tag,
+                    user_id=self.user_id,
+                    field_name=self.field_name,
+                    tags=self.tags,
+                    content_ids=content_ids,
+                ),
+                using=self._state.db,
             )
-            # Check if tags should be synced for a specific field
-            if self.field_name in sync.synchronise.keys():
-                # Get other objects with this tag ( then exclude the current one)
-                content_ids = copy.deepcopy(
-                    sync.synchronise[self.field_name],
-                )
-                content_ids.remove(
-                    self.tagged_field.content_id,
-                )
-
-                for content_id in content_ids:
-                    tagged_field_model = TaggedFieldModel.objects.get(
-                        content=content_id,
-                        model_name=ContentType.objects.get(id=content_id)
-                        .model_class()
-                        .__name__,
-                        field_name=self.field_name,
-                    )
-
-                    instance = UserTag.objects.get(
-                        user=self.user,
-                        tagged_field=tagged_field_model,
-                    )
-
-                    instance.tags = self.tags
-                    instance.save(
-                        sync_tags_save=True,
-                    )
-
-        super().save(*args, **kwargs)
 
 
 class SystemTag(TagBase):
@@ -11,6 +11,8 @@ from django.utils.translation import gettext_lazy as _
 
 from tag_me.utils.parser import parse_tags
 
+_NULL_PATTERN = re.compile(r"\bnull\b[\.,]?", re.IGNORECASE)
+
 
 class FieldTagListFormatter(list):
     """A custom tags list.
@@ -130,10 +132,9 @@ class FieldTagListFormatter(list):
             self.tags[i] = item
 
     @staticmethod
-    def _is_valid_tag(tag: str) -> bool:
+    def is_valid_tag(tag: str) -> bool:
         """Checks if a tag is a valid string and not a null value."""
-        null_pattern = re.compile(r"\bnull\b[\.,]?", re.IGNORECASE)
-        return isinstance(tag, str) and not null_pattern.match(tag)
+        return isinstance(tag, str) and not _NULL_PATTERN.match(tag)
 
     @staticmethod
     def _is_valid_tag_container(tags: dict | list | set | str | None) -> bool:
@@ -166,11 +167,13 @@ class FieldTagListFormatter(list):
             case _:  # Catch-all for invalid types
                 return False
 
-    def _is_valid_tag_list(self, tag_list: list[str]) -> bool:
+    @classmethod
+    def _is_valid_tag_list(cls, tag_list: list[str]) -> bool:
         """Checks if all tags in a list are valid."""
-        return all(self._is_valid_tag(tag) for tag in tag_list)
+        return all(cls.is_valid_tag(tag) for tag in tag_list)
 
-    def _extract_tags_from_dict(self, tags: dict[list[str] | str]) -> list:
+    @classmethod
+    def _extract_tags_from_dict(cls, tags: dict[list[str] | str]) -> list:
         """Extracts and validates tags from a dictionary.
 
         :param tags: The input dictionary.
@@ -182,13 +185,13 @@ class FieldTagListFormatter(list):
                                  error occurs during tag validation.
         """
         try:
-            if self._is_valid_tag_container(tags):
+            if cls._is_valid_tag_container(tags):
                 inner_tags: str | list = tags["tags"]
                 match inner_tags:
                     case str():
                         return parse_tags(inner_tags)
                     case list() | set():
-                        if self._is_valid_tag_list(inner_tags):
+                        if cls._is_valid_tag_list(inner_tags):
                             return inner_tags
                         else:
                             raise ValidationError(
@@ -219,11 +222,12 @@ class FieldTagListFormatter(list):
                             code="invalid",
                         )
         except ValidationError as e:
-            self.logger.error("An invalid dictionary was passed %s", e)
+            cls.logger.error("An invalid dictionary was passed %s", e)
             return []
 
+    @classmethod
     def _get_tag_list(
-        self,
+        cls,
         tags: (
             dict[str : list[str] | set[str] | str]  # noqa: E203
             | list[str]
@@ -252,9 +256,9 @@ class FieldTagListFormatter(list):
 
         match tags:
             case dict():
-                return self._extract_tags_from_dict(tags)
+                return cls._extract_tags_from_dict(tags)
             case list() | set():
-                if self._is_valid_tag_list(tags):
+                if cls._is_valid_tag_list(tags):
                     return tags
                 else:
                     raise ValidationError(
@@ -304,27 +308,11 @@ class FieldTagListFormatter(list):
         :raises ValidationError: If the input `tags` is of an invalid type or the tags within are invalid. # noqa: E501
         """
         try:
-            if self._is_valid_tag_container(tags):
-                tag_list = self._get_tag_list(tags)
-
-                for tag in tag_list:
-                    if self._is_valid_tag(tag) and tag not in self.tags:
-                        self.tags.append(tag)
+            for tag in self._get_valid_tags(tags):
+                if tag not in self.tags:
+                    self.tags.append(tag)
 
-                return sorted(self.tags)
-
-            else:
-                raise ValidationError(
-                    _(
-                        "%(value)s must be dict or list or set containing "
-                        "strings, or a string or None, type is %(val_type)s"
-                    ),
-                    params={
-                        "value": tags,
-                        "val_type": type(tags),
-                    },
-                    code="invalid",
-                )
+            return sorted(self.tags)
 
         except ValidationError as e:
 
@@ -335,6 +323,67 @@ class FieldTagListFormatter(list):
 
             return []
 
+    @classmethod
+    def _get_valid_tags(
+        cls,
+        tags: (
+            dict[str : list[str] | set[str] | str]  # noqa: E203
+            | list[str]
+            | set[str]
+            | str
+            | None
+        ) = None,
+    ) -> list[str]:
+        """Returns the valid tags from `tags`, in the order they were given.
+
+        :raises ValidationError: If the input `tags` is of an invalid type or the tags within are invalid. # noqa: E501
+        """
+        if not cls._is_valid_tag_container(tags):
+            raise ValidationError(
+                _(
+                    "%(value)s must be dict or list or set containing "
+                    "strings, or a string or None, type is %(val_type)s"
+                ),
+                params={
+                    "value": tags,
+                    "val_type": type(tags),
+                },
+                code="invalid",
+            )
+
+        return [
+            tag for tag in cls._get_tag_list(tags) if cls.is_valid_tag(tag)
+        ]
+
+    @classmethod
+    def normalize_csv(
+        cls,
+        tags: (
+            dict[str : list[str] | set[str] | str]  # noqa: E203
+            | list[str]
+            | set[str]
+            | str
+            | None
+        ) = None,
+    ) -> str:
+        """Returns `tags` as `toCSV(include_trailing_comma=True)` would.
+
+        Equivalent to `FieldTagListFormatter(tags).toCSV(True)` without
+        building a formatter, used by the tag fields on every value.
+        """
+        try:
+            unique_tags = dict.fromkeys(cls._get_valid_tags(tags))
+        except ValidationError as e:
+            cls.logger.error(
+                "An invalid tag or container was passed %s",
+                e,
+            )
+            return ""
+
+        if not unique_tags:
+            return ""
+        return ", ".join(unique_tags) + ","
+
     def add_tags(
         self,
         tags: (
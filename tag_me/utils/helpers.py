@@ -8,6 +8,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
+from tag_me.db.models.fields import TagMeCharField
 from tag_me.models import UserTag
 
 User = get_user_model()
@@ -33,8 +34,6 @@ def get_model_tagged_fields_field_and_verbose(
     :param model_verbose_name: (Optional) The display name of a model to filter by.
     :return: A list of tuples ready to be used in forms.
     """
-    from tag_me.db.models.fields import TagMeCharField
-
     _tagged_field_list_choices = [
         (None, None)
     ]  # Placeholder for 'no selection' option
@@ -75,12 +74,7 @@ def get_models_with_tagged_fields() -> list[models.Model]:
     Returns:
         list[models.Model]: A list of Django model classes that have at least one
             ``TagMeCharField`` field.
-
-    Raises:
-        ImportError: If the `tag_me.db.models.fields` module cannot be imported.
     """
-    from tag_me.db.models.fields import TagMeCharField
-
     # Check if the project has a custom list of apps for efficiency
     match settings.PROJECT_APPS:
         case None:
@@ -118,8 +112,6 @@ def get_models_with_tagged_fields_choices() -> list[tuple]:
 
     :return: A list of tuples ready to be used in forms to select models.
     """
-    from tag_me.db.models.fields import TagMeCharField
-
     _tagged_field_model_choices = [(None, None)]
     for model in get_models_with_tagged_fields():
         for field in model._meta.fields:
@@ -153,8 +145,6 @@ def get_model_tagged_fields_choices(
     :param feature_name:  (Optional) The 'verbose_name' of a model to filter by.
     :return: A list of tuples ready to be used in forms.
     """
-    from tag_me.db.models.fields import TagMeCharField
-
     if not feature_name:
         feature_name = ""  # Allow filtering by any model
 
@@ -11,7 +11,9 @@ from django.db import (
     IntegrityError,
     transaction,
 )
+from django.db.models import Q
 
+from tag_me.db.models.fields import clear_tagged_field_cache
 from tag_me.models import (
     TagBase,
     TaggedFieldModel,
@@ -28,6 +30,14 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# The `TaggedFieldModel` columns kept in step with the tagged fields.
+_TAGGED_FIELD_UPDATE_FIELDS = [
+    "field_verbose_name",
+    "model_name",
+    "model_verbose_name",
+    "tag_type",
+]
+
 
 def generate_user_tag_table_records(
     user=None,
@@ -114,9 +124,12 @@ def generate_user_tag_table_records(
                         comment="Auto generated, please add tags and update/delete this comment",
                     )
                 )
-            with transaction.atomic():
-                # Note: Bulk create UserTag objects, ignoring conflicts due to unique constraints.
-                UserTag.objects.bulk_create(user_tags, ignore_conflicts=True)
+        # Created once for every user, rather than after each user.
+        with transaction.atomic():
+            # Note: Bulk create UserTag objects, ignoring conflicts due to unique constraints.
+            UserTag.objects.bulk_create(
+                user_tags, ignore_conflicts=True, batch_size=1000
+            )
 
         stdout_with_optional_color(
             message=f"    SUCCESS: Added {len(user_tags)} user tags rows in to the UserTag table for {len(users)} users!",
@@ -145,7 +158,7 @@ def generate_user_tag_table_records(
         raise ValidationError(msg)
 
 
-def update_models_with_tagged_fields_table() -> None:
+def update_models_with_tagged_fields_table() -> TagMeSynchronise | None:
     """Updates the Tagged Field Models table for managing tagged fields.
 
     This function helps manage the models and fields in your Django project
@@ -158,51 +171,93 @@ def update_models_with_tagged_fields_table() -> None:
         'TaggedFieldModel' table.  This provides a centralized way to see which
         models and fields use tags.
 
+    :return: The updated default `TagMeSynchronise`, or None if no models
+             have tagged fields.
     """
-    for model in get_models_with_tagged_fields():
-        content = ContentType.objects.get_for_model(model, for_concrete_model=True)
+    tagged_fields = {}
+    # Content types for every model are fetched with one query.
+    contents = ContentType.objects.get_for_models(
+        *get_models_with_tagged_fields(), for_concrete_models=True
+    )
+    for content in contents.values():
         model_name = content.model_class().__name__
         model_verbose_name = content.model_class()._meta.verbose_name
         for field in get_model_tagged_fields_field_and_verbose(
             model_name=model_name,
             return_field_objects_only=True,
         ):
-            match field:
-                case None:  # Ignore if specific field name is missing
-                    # We test for None because the first tuple returned is None
-                    pass
-                case _:
-                    (
-                        obj,
-                        created,
-                    ) = TaggedFieldModel.objects.update_or_create(
-                        content=content,
-                        field_name=field.name,
-                        field_verbose_name=field.verbose_name,
-                        model_name=model_name,
-                        model_verbose_name=model_verbose_name,
-                        tag_type=field.tag_type,
-                    )  # Add or update the database entry
-
-                    match created:
-                        case True:
-                            logger.info(
-                                f"\n-- Created {obj} : {field}"
-                            )  # Log a new entry
-                        case False:
-                            logger.info(
-                                f"\n-- Updated {obj} : {field}"
-                            )  # Log an updated entry
-        update_fields_that_should_be_synchronised()
-
-
-def update_fields_that_should_be_synchronised():
+            tagged_fields[(content.id, field.name)] = TaggedFieldModel(
+                content=content,
+                field_name=field.name,
+                field_verbose_name=field.verbose_name,
+                model_name=model_name,
+                model_verbose_name=model_verbose_name,
+                tag_type=field.tag_type,
+            )
+
+    if not tagged_fields:
+        logger.debug("No tagged fields found, nothing to update.")
+        return
+
+    # Fetch the compared columns of the existing entries in one query,
+    # without building model instances, and create the rest.
+    existing = TaggedFieldModel.objects.filter(
+        content_id__in={content_id for content_id, _ in tagged_fields},
+        field_name__in={field_name for _, field_name in tagged_fields},
+    ).values_list(
+        "pk", "content_id", "field_name", *_TAGGED_FIELD_UPDATE_FIELDS
+    )
+    to_update = []
+    for pk, content_id, field_name, *stored in existing:
+        tagged_field = tagged_fields.pop((content_id, field_name), None)
+        if tagged_field is None:
+            continue
+        # Verbose names may be lazy translations.
+        current = [
+            str(getattr(tagged_field, name))
+            for name in _TAGGED_FIELD_UPDATE_FIELDS
+        ]
+        # Only rows that differ are written, usually none of them.
+        if current != stored:
+            tagged_field.pk = pk
+            to_update.append(tagged_field)
+    to_create = list(tagged_fields.values())
+
+    # The table and the sync config are committed together.
+    with transaction.atomic():
+        # Rows added by a concurrent run are left as they are.
+        TaggedFieldModel.objects.bulk_create(to_create, ignore_conflicts=True)
+        TaggedFieldModel.objects.bulk_update(
+            to_update, _TAGGED_FIELD_UPDATE_FIELDS
+        )
+        sync = update_fields_that_should_be_synchronised()
+    # Bulk writes don't send the signals that clear this cache.
+    clear_tagged_field_cache()
+
+    logger.info(
+        "Tagged fields table: %s created, %s updated.",
+        len(to_create),
+        len(to_update),
+    )
+    # Skip the loops entirely unless the entries will be logged.
+    if logger.isEnabledFor(logging.DEBUG):
+        for obj in to_create:
+            logger.debug("\n-- Created %s", obj)  # Log a new entry
+        for obj in to_update:
+            logger.debug("\n-- Updated %s", obj)  # Log an updated entry
+
+    return sync
+
+
+def update_fields_that_should_be_synchronised() -> TagMeSynchronise:
     """
     Updates the synchronization configuration to include fields marked for tag synchronization.
 
     This function scans all models and checks for fields that have the 'synchronise'
     attribute set to True. If found, it updates the 'TagMeSynchronise' model (named 'default')
     to ensure that tags applied to those fields will be synchronised across relevant content types.
+
+    :return: The default `TagMeSynchronise`, so callers needn't fetch it again.
     """
 
     # Retrieve or create the default synchronization configuration
@@ -236,3 +291,20 @@ def update_fields_that_should_be_synchronised():
     # Save the updated synchronization configuration if changes were made
     if sync_updated:
         sync.save()
+
+    # Flag the tagged fields that are synchronised with another content type,
+    # so saving a user tag on any other field can skip the sync lookup.
+    synchronised = Q(pk__in=[])
+    for field_name, content_ids in sync.synchronise.items():
+        if len(content_ids) > 1:
+            synchronised |= Q(
+                field_name=field_name, content_id__in=content_ids
+            )
+    TaggedFieldModel.objects.filter(
+        synchronised, is_synchronised=False
+    ).update(is_synchronised=True)
+    TaggedFieldModel.objects.exclude(synchronised).filter(
+        is_synchronised=True
+    ).update(is_synchronised=False)
+
+    return sync
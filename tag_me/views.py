@@ -80,6 +80,8 @@ class MgmtUserTagListView(ListView):
     """List user tags."""
 
     model = UserTag
+    # The template shows each tag's user.
+    queryset = UserTag.objects.select_related("user")
     form_class = UserTagListForm
     template_name = "tag_me/mgmt/list_user_tag.html"
     success_url = reverse_lazy("tag_me:tag-mgmt")
@@ -95,11 +97,16 @@ class UserTagEditView(UpdateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["usertag"] = UserTag.objects.get(id=self.kwargs["pk"])
+        context["usertag"] = UserTag.objects.select_related("user").get(
+            id=self.kwargs["pk"]
+        )
         return context
 
     def form_valid(self, form):
-        usertag = UserTag.objects.get(id=self.kwargs["pk"])
+        # The tagged field is read when the save synchronises the tags.
+        usertag = UserTag.objects.select_related("tagged_field").get(
+            id=self.kwargs["pk"]
+        )
         usertag.tags = form.cleaned_data["tags"]
         usertag.save()
         return super().form_valid(form)
@@ -126,7 +133,9 @@ class WidgetAddUserTagView(View):
                 base64.urlsafe_b64decode(encoded_data).decode("utf-8")
             )
             try:
-                user_tag = UserTag.objects.get(id=self.kwargs["pk"])
+                user_tag = UserTag.objects.select_related("tagged_field").get(
+                    id=self.kwargs["pk"]
+                )
             except ObjectDoesNotExist:
                 return JsonResponse({"error": "UserTag not found"}, status=404)
             all_tags = FieldTagListFormatter(user_tag.tags)
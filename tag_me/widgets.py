@@ -67,6 +67,8 @@ class TagMeSelectMultipleWidget(forms.SelectMultiple):
             "template", settings.DJ_TAG_ME_TEMPLATES["default"]
         )
         user = self.attrs.pop("user", None)
+        # Set by TagMeModelFormMixin, which fetches all the form's tags at once
+        user_tags_by_field = self.attrs.pop("user_tags", None)
 
         # Call the parent class render (essential for Widget functionality)
         super().render(name, value, attrs, renderer)
@@ -79,16 +81,30 @@ class TagMeSelectMultipleWidget(forms.SelectMultiple):
             _permitted_to_add_tags = False
         else:
             # Dynamically fetch user and field specific choices as a list.
-            user_tags = UserTag.objects.filter(
-                user=user,
-                tagged_field=_tagged_field,
-            ).first()
-
-            if user_tags.tags:
-                self.choices = [tag.strip() for tag in user_tags.tags.split(",")]
-            else:
+            user_tags = None
+            # The lazy tagged field resolves to None until the field has a
+            # row, and to an unsaved placeholder if the table is missing.
+            tagged_field_id = getattr(_tagged_field, "pk", None)
+            if tagged_field_id is not None and user_tags_by_field is not None:
+                user_tags = user_tags_by_field.get(tagged_field_id)
+            elif tagged_field_id is not None:
+                user_tags = UserTag.objects.filter(
+                    user=user,
+                    tagged_field=_tagged_field,
+                ).first()
+
+            if user_tags is None:
+                # Nothing to choose from or add tags to yet.
                 self.choices = []
-            _add_tag_url = reverse("tag_me:add-tag", args=[user_tags.id])
+                _permitted_to_add_tags = False
+            else:
+                if user_tags.tags:
+                    self.choices = [
+                        tag.strip() for tag in user_tags.tags.split(",")
+                    ]
+                else:
+                    self.choices = []
+                _add_tag_url = reverse("tag_me:add-tag", args=[user_tags.id])
 
         values: list = []
         match value:
@@ -515,6 +515,37 @@ class TestFormattedReturns(BaseFormatterTest):
         assert tags == ["tag"]
 
 
+class TestNormalizeCSV(BaseFormatterTest):
+    @h_settings(deadline=TEST_DEADLINE_TIME)
+    @given(
+        st.one_of(
+            st.none(),
+            st.text(),
+            st.lists(st.text()),
+            st.sets(st.text()),
+            valid_tag_dictionaries(),
+        )
+    )
+    def test_matches_formatter_toCSV(self, tags):
+        expected = FieldTagListFormatter(tags).toCSV(
+            include_trailing_comma=True
+        )
+
+        assert FieldTagListFormatter.normalize_csv(tags) == expected
+
+    def test_keeps_list_order_and_removes_duplicates(self):
+        tags = ["zero", "one", "zero"]
+
+        assert FieldTagListFormatter.normalize_csv(tags) == "zero, one,"
+
+    @mock.patch("tag_me.utils.collections.FieldTagListFormatter.logger")
+    def test_unsupported_type_logs_error(self, mock_logger):
+        assert FieldTagListFormatter.normalize_csv(1.5) == ""
+        assert mock_logger.error.call_args.args[0] == (
+            "An invalid tag or container was passed %s"
+        )
+
+
 # ****************************    Init   *********************************
 
 
@@ -778,16 +809,16 @@ class TestIsValidTag(BaseFormatterTest):
 
     @given(st.text())
     def test_valid_strings(self, tag):
-        assert self.formatter._is_valid_tag(tag)
+        assert self.formatter.is_valid_tag(tag)
 
     def test_invalid_null_variants(self):
         invalid_tags = ["null", "NULL", "Null", "null.", "null,"]
         for tag in invalid_tags:
-            assert not self.formatter._is_valid_tag(tag)
+            assert not self.formatter.is_valid_tag(tag)
 
     @given(st.one_of(st.integers(), st.floats(), st.booleans(), st.none()))
     def test_invalid_non_strings(self, value):
-        assert not self.formatter._is_valid_tag(value)
+        assert not self.formatter.is_valid_tag(value)
 
 
 class TestIsValidTagList(BaseFormatterTest):
@@ -1,10 +1,25 @@
 """tag-me model field tests"""
 
+from django import forms
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.core import validators
-from django.test import SimpleTestCase
+from django.test import SimpleTestCase, TestCase
 
 from tag_me.db.forms.fields import TagMeCharField
+from tag_me.db.forms.mixins import TagMeModelFormMixin
+from tag_me.db.models.fields import clear_tagged_field_cache
+from tag_me.models import TaggedFieldModel, UserTag
 from tag_me.utils.collections import FieldTagListFormatter
+from tests.models import TaggedFieldTestModel
+
+User = get_user_model()
+
+
+class TaggedFieldTestForm(TagMeModelFormMixin, forms.ModelForm):
+    class Meta:
+        model = TaggedFieldTestModel
+        fields = ["tagged_field_1", "tagged_field_2"]
 
 
 class TestTagMeCharFieldForm(SimpleTestCase):
@@ -20,6 +35,12 @@ class TestTagMeCharFieldForm(SimpleTestCase):
             include_trailing_comma=True,
         )
 
+    def test_values_not_shared_between_calls(self):
+        f = TagMeCharField()
+        f.to_python("a, b")
+
+        assert f.to_python("c") == "c,"
+
     def test_validators(self):
         f = TagMeCharField(
             min_length=1234,
@@ -43,3 +64,57 @@ class TestTagMeCharFieldForm(SimpleTestCase):
             for x in f.validators
             if isinstance(x, validators.ProhibitNullCharactersValidator)
         )
+
+
+class TestTagMeModelFormMixin(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(
+            username="form_user",
+            password="pw_form_user",
+            email="form_user@email.com",
+        )
+        content = ContentType.objects.get_for_model(TaggedFieldTestModel)
+        self.user_tags = {}
+        for field_name in ("tagged_field_1", "tagged_field_2"):
+            tagged_field, _ = TaggedFieldModel.objects.get_or_create(
+                content=content,
+                field_name=field_name,
+            )
+            self.user_tags[field_name] = UserTag.objects.create(
+                user=self.user,
+                tagged_field=tagged_field,
+                field_name=field_name,
+                tags=f"{field_name},",
+            )
+        clear_tagged_field_cache()
+
+    def test_form_init_runs_no_queries(self):
+        with self.assertNumQueries(0):
+            TaggedFieldTestForm(user=self.user)
+
+    def test_user_tags_fetched_in_one_query(self):
+        form = TaggedFieldTestForm(user=self.user)
+        user_tags = form.fields["tagged_field_1"].widget.attrs["user_tags"]
+        # As rendering the first widget does before loading the tags.
+        form.fields["tagged_field_1"].widget.attrs.pop("tagged_field")
+        # Warm the tagged field cache so only the user tags are counted.
+        TaggedFieldTestModel._meta.get_field(
+            "tagged_field_1"
+        )._get_tagged_field()
+
+        with self.assertNumQueries(1):
+            assert dict(user_tags) == {
+                user_tag.tagged_field_id: user_tag
+                for user_tag in self.user_tags.values()
+            }
+        # Shared by every tagged field on the form.
+        assert form.fields["tagged_field_2"].widget.attrs["user_tags"] is (
+            user_tags
+        )
+
+    def test_no_user_skips_query(self):
+        form = TaggedFieldTestForm()
+
+        with self.assertNumQueries(0):
+            user_tags = form.fields["tagged_field_1"].widget.attrs["user_tags"]
+            assert dict(user_tags) == {}
@@ -5,11 +5,15 @@
 # from contextlib import redirect_stdout
 
 from io import StringIO
+from unittest import mock
 
 # import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 
 # from django.contrib.contenttypes.models import ContentType
 # from django.core import management
@@ -19,7 +23,8 @@ from django.core.management import call_command
 # from hypothesis import strategies as st
 from hypothesis.extra.django import TestCase
 
-from tag_me.models import TaggedFieldModel, UserTag
+from tag_me.db.models import fields as model_fields
+from tag_me.models import TaggedFieldModel, TagMeSynchronise, UserTag
 from tag_me.utils.helpers import (  # update_models_with_tagged_fields_table,
     get_model_content_type,
     get_model_tagged_fields_choices,
@@ -29,8 +34,11 @@ from tag_me.utils.helpers import (  # update_models_with_tagged_fields_table,
     get_user_field_choices_as_list_tuples,
 )
 from tag_me.utils.tag_mgmt_system import (
+    generate_user_tag_table_records,
+    update_fields_that_should_be_synchronised,
     update_models_with_tagged_fields_table,
 )
+from tests.models import TaggedFieldTestModel
 
 User = get_user_model()
 
@@ -227,3 +235,184 @@ class TestTagHelpers(TestCase):
         assert not TaggedFieldModel.objects.all().exists()
         update_models_with_tagged_fields_table()
         assert TaggedFieldModel.objects.all().exists()
+
+    def test_synchronised_fields_flagged(self):
+        TagMeSynchronise.objects.filter(name="default").update(
+            synchronise={
+                "tagged_field_1": [
+                    self.model_1_field_1.content_id,
+                    self.model_1_field_1.content_id + 1000,
+                ],
+            }
+        )
+        TaggedFieldModel.objects.filter(pk=self.model_1_field_2.pk).update(
+            is_synchronised=True
+        )
+
+        update_fields_that_should_be_synchronised()
+
+        self.model_1_field_1.refresh_from_db()
+        self.model_1_field_2.refresh_from_db()
+        assert self.model_1_field_1.is_synchronised
+        assert not self.model_1_field_2.is_synchronised
+
+    def test_single_content_type_field_not_flagged(self):
+        TagMeSynchronise.objects.filter(name="default").update(
+            synchronise={
+                "tagged_field_1": [self.model_1_field_1.content_id],
+            }
+        )
+
+        update_fields_that_should_be_synchronised()
+
+        self.model_1_field_1.refresh_from_db()
+        assert not self.model_1_field_1.is_synchronised
+
+    def test_tagged_field_models_table_updates_changed_field(self):
+        TaggedFieldModel.objects.filter(pk=self.model_1_field_1.pk).update(
+            field_verbose_name="Old verbose name"
+        )
+
+        update_models_with_tagged_fields_table()
+
+        tagged_fields = TaggedFieldModel.objects.filter(
+            content_id=self.model_1_field_1.content_id,
+            field_name=self.model_1_field_1.field_name,
+        )
+        assert tagged_fields.count() == 1
+        assert tagged_fields.get().pk == self.model_1_field_1.pk
+        assert tagged_fields.get().field_verbose_name != "Old verbose name"
+
+    def test_tagged_field_models_table_clears_tagged_field_cache(self):
+        field = TaggedFieldTestModel._meta.get_field("tagged_field_1")
+        field._get_tagged_field()
+        assert model_fields._TAGGED_FIELD_CACHE
+
+        update_models_with_tagged_fields_table()
+
+        assert not model_fields._TAGGED_FIELD_CACHE
+
+    def test_tagged_field_models_table_fetches_content_types_together(self):
+        ContentType.objects.clear_cache()
+
+        with mock.patch.object(
+            ContentType.objects,
+            "get_for_models",
+            wraps=ContentType.objects.get_for_models,
+        ) as get_for_models, mock.patch.object(
+            ContentType.objects, "get_for_model"
+        ) as get_for_model:
+            update_models_with_tagged_fields_table()
+
+        get_for_models.assert_called_once()
+        get_for_model.assert_not_called()
+        assert TaggedFieldModel.objects.filter(
+            content=ContentType.objects.get_for_model(TaggedFieldTestModel)
+        ).exists()
+
+    def test_tagged_field_models_table_rolled_back_with_sync_config(self):
+        TaggedFieldModel.objects.all().delete()
+
+        with mock.patch(
+            "tag_me.utils.tag_mgmt_system."
+            "update_fields_that_should_be_synchronised",
+            side_effect=DatabaseError,
+        ):
+            with self.assertRaises(DatabaseError):
+                update_models_with_tagged_fields_table()
+
+        assert not TaggedFieldModel.objects.exists()
+
+    def test_tagged_field_models_table_skips_unchanged_fields(self):
+        update_models_with_tagged_fields_table()
+
+        with mock.patch.object(
+            TaggedFieldModel.objects, "bulk_update"
+        ) as bulk_update:
+            update_models_with_tagged_fields_table()
+
+        bulk_update.assert_called_once_with([], mock.ANY)
+
+    def test_tagged_field_models_table_no_tagged_fields(self):
+        with mock.patch(
+            "tag_me.utils.tag_mgmt_system.get_models_with_tagged_fields",
+            return_value=[],
+        ), self.assertNumQueries(0):
+            update_models_with_tagged_fields_table()
+
+    def test_tagged_field_models_table_returns_sync_config(self):
+        sync = update_models_with_tagged_fields_table()
+
+        assert sync == TagMeSynchronise.objects.get(name="default")
+
+    def test_tagged_field_models_table_ignores_existing_rows(self):
+        # As if another run added the rows after they were looked up.
+        with mock.patch.object(
+            TaggedFieldModel.objects,
+            "filter",
+            return_value=TaggedFieldModel.objects.none(),
+        ):
+            update_models_with_tagged_fields_table()
+
+        assert not TaggedFieldModel.objects.filter(
+            content_id=self.model_1_field_1.content_id,
+            field_name=self.model_1_field_1.field_name,
+        ).exclude(pk=self.model_1_field_1.pk)
+
+    def test_tagged_field_models_table_logs_updated_fields(self):
+        TaggedFieldModel.objects.filter(pk=self.model_1_field_1.pk).update(
+            field_verbose_name="Old verbose name"
+        )
+
+        with self.assertLogs("tag_me.utils.tag_mgmt_system", "DEBUG") as logs:
+            update_models_with_tagged_fields_table()
+
+        assert logs.output == [
+            "INFO:tag_me.utils.tag_mgmt_system:"
+            "Tagged fields table: 0 created, 1 updated.",
+            "DEBUG:tag_me.utils.tag_mgmt_system:\n-- Updated "
+            f"{TaggedFieldModel.objects.get(pk=self.model_1_field_1.pk)}",
+        ]
+
+    def test_tagged_field_models_table_logs_one_info_summary(self):
+        TaggedFieldModel.objects.filter(pk=self.model_1_field_1.pk).update(
+            field_verbose_name="Old verbose name"
+        )
+
+        with self.assertLogs("tag_me.utils.tag_mgmt_system", "INFO") as logs:
+            update_models_with_tagged_fields_table()
+
+        assert logs.output == [
+            "INFO:tag_me.utils.tag_mgmt_system:"
+            "Tagged fields table: 0 created, 1 updated.",
+        ]
+
+    def test_tagged_field_models_table_loads_compared_columns_only(self):
+        with CaptureQueriesContext(connection) as queries:
+            update_models_with_tagged_fields_table()
+
+        lookup = next(
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "tag_me_taggedfieldmodel"' in query["sql"]
+        )
+        assert '"tag_me_taggedfieldmodel"."field_verbose_name"' in lookup
+        assert "default_tags" not in lookup
+
+    def test_generate_user_tag_table_records_creates_once(self):
+        users = [
+            User.objects.create(username=f"bulk_user_{i}") for i in range(3)
+        ]
+
+        with mock.patch.object(
+            UserTag.objects,
+            "bulk_create",
+            wraps=UserTag.objects.bulk_create,
+        ) as bulk_create:
+            generate_user_tag_table_records()
+
+        bulk_create.assert_called_once()
+        assert UserTag.objects.filter(user__in=users).count() == (
+            3 * TaggedFieldModel.objects.count()
+        )
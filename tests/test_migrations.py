@@ -0,0 +1,118 @@
+"""tag-me migration tests"""
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class TestRemoveDuplicateTaggedFields(TransactionTestCase):
+    """Test duplicate tagged fields are removed without losing user tags."""
+
+    migrate_from = [("tag_me", "0002_taggedfieldmodel_is_synchronised")]
+    migrate_to = [("tag_me", "0003_taggedfieldmodel_unique_content_field")]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+
+        ContentType = apps.get_model("contenttypes", "ContentType")
+        TaggedFieldModel = apps.get_model("tag_me", "TaggedFieldModel")
+        UserTag = apps.get_model("tag_me", "UserTag")
+        User = apps.get_model("auth", "User")
+
+        # A content type of its own, so no other row can be the oldest.
+        content = ContentType.objects.create(
+            app_label="tests", model="duplicatedfield"
+        )
+        self.kept, self.duplicate = (
+            TaggedFieldModel.objects.create(
+                content=content,
+                model_name="Post",
+                field_name="title",
+                field_verbose_name=verbose_name,
+            )
+            for verbose_name in ("title", "old title")
+        )
+        self.moved_user = User.objects.create(username="moved_user")
+        self.merged_user = User.objects.create(username="merged_user")
+        self.full_user = User.objects.create(username="full_user")
+        UserTag.objects.create(
+            user=self.moved_user,
+            tagged_field=self.duplicate,
+            tags="moved,",
+            slug="moved",
+        )
+        UserTag.objects.create(
+            user=self.merged_user,
+            tagged_field=self.kept,
+            tags="kept, both,",
+            slug="kept",
+        )
+        UserTag.objects.create(
+            user=self.merged_user,
+            tagged_field=self.duplicate,
+            tags="both, merged,",
+            slug="merged",
+        )
+        # 251 characters, room for one more short tag before 255.
+        self.full_tags = "x" * 250 + ","
+        UserTag.objects.create(
+            user=self.full_user,
+            tagged_field=self.kept,
+            tags=self.full_tags,
+            slug="full",
+        )
+        UserTag.objects.create(
+            user=self.full_user,
+            tagged_field=self.duplicate,
+            tags="a, bb, zz,",
+            slug="overflow",
+        )
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        with self.assertLogs(
+            "tag_me.migrations.0003_taggedfieldmodel_unique_content_field",
+            "WARNING",
+        ) as logs:
+            executor.migrate(self.migrate_to)
+        self.logs = logs.output
+        self.apps = executor.loader.project_state(self.migrate_to).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_duplicate_tagged_field_removed(self):
+        TaggedFieldModel = self.apps.get_model("tag_me", "TaggedFieldModel")
+
+        remaining = TaggedFieldModel.objects.filter(
+            pk__in=[self.kept.pk, self.duplicate.pk]
+        )
+        assert list(remaining.values_list("pk", flat=True)) == [self.kept.pk]
+
+    def test_user_tags_moved_to_kept_field(self):
+        UserTag = self.apps.get_model("tag_me", "UserTag")
+
+        user_tag = UserTag.objects.get(user_id=self.moved_user.pk)
+        assert user_tag.tagged_field_id == self.kept.pk
+        assert user_tag.tags == "moved,"
+
+    def test_user_tags_merged_into_existing_row(self):
+        UserTag = self.apps.get_model("tag_me", "UserTag")
+
+        user_tag = UserTag.objects.get(user_id=self.merged_user.pk)
+        assert user_tag.tagged_field_id == self.kept.pk
+        assert user_tag.tags == "both, kept, merged,"
+
+    def test_overlong_merge_keeps_tags_that_fit(self):
+        UserTag = self.apps.get_model("tag_me", "UserTag")
+
+        user_tag = UserTag.objects.get(user_id=self.full_user.pk)
+        assert user_tag.tagged_field_id == self.kept.pk
+        assert user_tag.tags == "a, " + self.full_tags
+        assert len(user_tag.tags) <= 255
+        assert len(self.logs) == 1
+        assert "bb, zz" in self.logs[0]
@@ -1,13 +1,34 @@
 """tag-me model field tests"""
 
+import time
+from unittest import mock
+
+from django import forms
+from django.apps import apps
+from django.contrib.admin.widgets import AdminTextInputWidget
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
 from django.core import validators
 from django.core.exceptions import ValidationError
-from django.db import models
-from django.test import SimpleTestCase
+from django.db import OperationalError, models
+from django.db.models.signals import post_migrate, post_save
+from django.test import SimpleTestCase, override_settings
+from django.utils import translation
 from hypothesis.extra.django import TestCase
 
-from tag_me.db.models.fields import TagMeCharField
-from tag_me.models import UserTag
+from tag_me.db.forms.fields import TagMeCharField as TagMeCharField_FORM
+from tag_me.db.models import fields as model_fields
+from tag_me.db.models.fields import (
+    _MISSING_TAGGED_FIELD_TIMEOUT,
+    _TAGGED_FIELD_CACHE_TIMEOUT,
+    TagMeCharField,
+    _choices_to_tags,
+    _log_invalid_choices_type,
+    _log_tagged_field_table_error,
+    _normalize_tag_string,
+    clear_tagged_field_cache,
+)
+from tag_me.models import TaggedFieldModel, UserTag
 from tag_me.utils.collections import FieldTagListFormatter
 from tests.models import TaggedFieldTestModel
 
@@ -65,6 +86,217 @@ class TestTagMeCharField(TestCase):
     #     assert Event.C == tag_2.tagged_field_1
 
 
+class TestTaggedFieldCache(TestCase):
+    def setUp(self):
+        clear_tagged_field_cache()
+        _log_tagged_field_table_error.cache_clear()
+        self.field = TaggedFieldTestModel._meta.get_field("tagged_field_1")
+
+    def test_tagged_field_resolved_lazily(self):
+        with self.assertNumQueries(0):
+            tagged_field = self.field.formfield().widget.attrs["tagged_field"]
+
+        with self.assertNumQueries(1):
+            assert tagged_field.field_name == "tagged_field_1"
+
+    def test_lazy_tagged_field_filters_user_tags(self):
+        user = get_user_model().objects.create(username="widget_user")
+        user_tag = UserTag.objects.create(
+            user=user,
+            tagged_field=self.field._get_tagged_field(),
+            field_name="tagged_field_1",
+            tags="apple, ball,",
+        )
+        tagged_field = self.field.formfield().widget.attrs["tagged_field"]
+
+        # As the widget does when it renders.
+        user_tags = UserTag.objects.filter(
+            user=user, tagged_field=tagged_field
+        )
+        assert user_tags.first() == user_tag
+
+    def test_tagged_field_cached(self):
+        first = self.field._get_tagged_field()
+
+        with self.assertNumQueries(0):
+            second = self.field._get_tagged_field()
+
+        assert first is not None
+        assert first is second
+
+    def test_tagged_field_cache_primed_for_all_fields(self):
+        self.field._get_tagged_field()
+
+        other_field = TaggedFieldTestModel._meta.get_field("tagged_field_2")
+        with self.assertNumQueries(0):
+            tagged_field = other_field._get_tagged_field()
+
+        assert tagged_field.field_name == "tagged_field_2"
+
+    def test_tagged_field_cache_skips_content_type_lookup(self):
+        self.field._get_tagged_field()
+        ContentType.objects.clear_cache()
+
+        with self.assertNumQueries(0):
+            tagged_field = self.field._get_tagged_field()
+
+        assert tagged_field.field_name == "tagged_field_1"
+
+    def test_tagged_field_cache_loads_lookup_columns_only(self):
+        tagged_field = self.field._get_tagged_field()
+
+        assert tagged_field.get_deferred_fields() == {
+            "model_name",
+            "model_verbose_name",
+            "field_verbose_name",
+            "tag_type",
+            "default_tags",
+            "is_synchronised",
+        }
+
+    def test_verbose_names_resolved_once_per_language(self):
+        self.field._verbose_names.clear()
+
+        with translation.override("en"):
+            attrs = self.field.formfield().widget.attrs
+            self.field.formfield()
+        with translation.override("fr"):
+            self.field.formfield()
+
+        assert attrs["model_verbose_name"] == "Tagged Field Test Model"
+        assert type(attrs["field_verbose_name"]) is str
+        assert set(self.field._verbose_names) == {
+            ("en", "tests.TaggedFieldTestModel"),
+            ("fr", "tests.TaggedFieldTestModel"),
+        }
+
+    def test_tagged_field_placeholder_when_table_missing(self):
+        with mock.patch(
+            "tag_me.db.models.fields._prime_tagged_field_cache",
+            side_effect=OperationalError("no such table"),
+        ):
+            with self.assertLogs("tag_me.db.models.fields", "ERROR") as logs:
+                tagged_field = self.field._get_tagged_field()
+
+        assert tagged_field.pk is None
+        assert logs.output[0].startswith(
+            "ERROR:tag_me.db.models.fields:no such table: Please check"
+        )
+
+    def test_cache_receivers_connected_once(self):
+        receivers = len(post_save.receivers), len(post_migrate.receivers)
+
+        apps.get_app_config("tag_me").ready()
+
+        assert (
+            len(post_save.receivers),
+            len(post_migrate.receivers),
+        ) == receivers
+
+    def test_missing_tagged_field_cached(self):
+        TaggedFieldModel.objects.filter(field_name="tagged_field_1").delete()
+
+        with self.assertNumQueries(1):
+            assert self.field._get_tagged_field() is None
+        with self.assertNumQueries(0):
+            assert self.field._get_tagged_field() is None
+
+    def test_missing_tagged_field_found_after_timeout(self):
+        TaggedFieldModel.objects.filter(field_name="tagged_field_1").delete()
+        assert self.field._get_tagged_field() is None
+        # Added by another process, so no signal clears the cache.
+        TaggedFieldModel.objects.bulk_create(
+            [
+                TaggedFieldModel(
+                    content=ContentType.objects.get_for_model(
+                        TaggedFieldTestModel
+                    ),
+                    field_name="tagged_field_1",
+                )
+            ]
+        )
+
+        with mock.patch(
+            "tag_me.db.models.fields.time.monotonic",
+            return_value=time.monotonic() + _MISSING_TAGGED_FIELD_TIMEOUT,
+        ):
+            tagged_field = self.field._get_tagged_field()
+
+        assert tagged_field.field_name == "tagged_field_1"
+
+    def test_tagged_field_reloaded_after_timeout(self):
+        first = self.field._get_tagged_field()
+        # Changed by another process, so no signal clears the cache.
+        TaggedFieldModel.objects.filter(pk=first.pk).update(
+            field_name="renamed"
+        )
+        replacement = TaggedFieldModel.objects.bulk_create(
+            [
+                TaggedFieldModel(
+                    content=ContentType.objects.get_for_model(
+                        TaggedFieldTestModel
+                    ),
+                    field_name="tagged_field_1",
+                )
+            ]
+        )[0]
+        assert self.field._get_tagged_field() is first
+
+        with mock.patch(
+            "tag_me.db.models.fields.time.monotonic",
+            return_value=time.monotonic() + _TAGGED_FIELD_CACHE_TIMEOUT,
+        ):
+            tagged_field = self.field._get_tagged_field()
+
+        assert tagged_field.pk == replacement.pk
+
+    def test_tagged_field_placeholder_not_cached(self):
+        with mock.patch(
+            "tag_me.db.models.fields._prime_tagged_field_cache",
+            side_effect=OperationalError("no such table"),
+        ) as prime:
+            with self.assertLogs("tag_me.db.models.fields", "ERROR") as logs:
+                self.field._get_tagged_field()
+                self.field._get_tagged_field()
+
+        # Retried each time, but only logged once.
+        assert prime.call_count == 2
+        assert len(logs.output) == 1
+        assert self.field._get_tagged_field().pk is not None
+
+    def test_widget_renders_without_tagged_field(self):
+        TaggedFieldModel.objects.filter(field_name="tagged_field_1").delete()
+        widget = self.field.formfield().widget
+
+        widget.render("tagged_field_1", "")
+
+        assert widget.choices == []
+
+    def test_tagged_field_cache_cleared_on_save(self):
+        tagged_field = self.field._get_tagged_field()
+        assert model_fields._TAGGED_FIELD_CACHE
+
+        tagged_field.save()
+
+        assert not model_fields._TAGGED_FIELD_CACHE
+
+    def test_tagged_field_cache_replaced_not_mutated(self):
+        self.field._get_tagged_field()
+        cache = model_fields._TAGGED_FIELD_CACHE
+        rows = dict(cache)
+
+        # A lookup in another thread holding `cache` keeps every row.
+        clear_tagged_field_cache()
+        with mock.patch(
+            "tag_me.db.models.fields.time.monotonic",
+            return_value=time.monotonic() + _TAGGED_FIELD_CACHE_TIMEOUT,
+        ):
+            self.field._get_tagged_field()
+
+        assert cache == rows
+        assert model_fields._TAGGED_FIELD_CACHE is not cache
+
+
 class TestMethods(SimpleTestCase):
     """Equivalent to Django test."""
 
@@ -405,6 +637,37 @@ class TestTagMeCharfieldtoPython(SimpleTestCase):
         # Check Django choices machinery is disabled.
         assert f.choices is None
 
+    def test_tags_choices_shared_between_fields(self):
+        _choices_to_tags.cache_clear()
+        list_choices: list = [
+            "Festival!",
+            "Carnival!",
+        ]
+        f1 = TagMeCharField(choices=list_choices)
+        f2 = TagMeCharField(choices=list(list_choices))
+
+        assert f1._tag_choices == f2._tag_choices == list_choices
+        assert f1._tag_choices is not f2._tag_choices
+        assert _choices_to_tags.cache_info().hits == 1
+
+    def test_tags_input_is_choices_mixed_LIST(self):
+        f = TagMeCharField(choices=[("Carnival!", "Carnival"), "Festival!"])
+
+        # Mixed choices are treated as a plain list, which has invalid tags.
+        assert f._tag_choices == []
+        assert f.choices is None
+
+    def test_tags_input_is_choices_invalid_type_logged_once(self):
+        _log_invalid_choices_type.cache_clear()
+
+        with self.assertLogs("tag_me.db.models.fields", "ERROR") as logs:
+            f1 = TagMeCharField(choices=("Carnival!", "Festival!"))
+            f2 = TagMeCharField(choices=("Carnival!", "Festival!"))
+
+        assert f1._tag_choices == f2._tag_choices == []
+        assert len(logs.output) == 1
+        assert "<class 'tuple'>" in logs.output[0]
+
     def test_tags_input_is_null_only_tags(self):
         null_tags = [
             "null",
@@ -416,6 +679,54 @@ class TestTagMeCharfieldtoPython(SimpleTestCase):
 
         assert f.to_python(null_tags) == ""
 
+    def test_str_input_cached(self):
+        _normalize_tag_string.cache_clear()
+        f = TagMeCharField()
+
+        assert f.to_python("ball apple") == "apple, ball,"
+        assert f.get_prep_value("ball apple") == "apple, ball,"
+        assert _normalize_tag_string.cache_info().hits == 1
+
+    def test_from_db_value_normalized_str_not_parsed(self):
+        _normalize_tag_string.cache_clear()
+        f = TagMeCharField()
+
+        assert f.from_db_value("apple, ball,", None, None) == "apple, ball,"
+        assert f.from_db_value("", None, None) == ""
+        assert _normalize_tag_string.cache_info().misses == 0
+
+    def test_from_db_value_normalized_str_parsed_with_custom_parser(self):
+        _normalize_tag_string.cache_clear()
+        f = TagMeCharField()
+
+        with override_settings(
+            TAGME_GET_TAGS_FROM_STRING="tag_me.utils.parser.split_strip"
+        ):
+            assert f.from_db_value("apple, ball,", None, None) == (
+                "apple, ball,"
+            )
+        assert _normalize_tag_string.cache_info().misses == 1
+
+    def test_from_db_value_unnormalized_str_parsed(self):
+        f = TagMeCharField()
+
+        assert f.from_db_value("ball, apple,", None, None) == "apple, ball,"
+        assert f.from_db_value("apple,ball,", None, None) == "apple, ball,"
+        assert f.from_db_value("apple, apple,", None, None) == "apple,"
+        assert f.from_db_value(" apple,", None, None) == "apple,"
+        assert f.from_db_value("null,", None, None) == ""
+        assert f.from_db_value('"apple,', None, None) == "apple,"
+        assert f.from_db_value(None, None, None) == ""
+
+    def test_str_input_uses_configured_parser(self):
+        f = TagMeCharField()
+
+        assert f.to_python("ball, apple") == "apple, ball,"
+        with override_settings(
+            TAGME_GET_TAGS_FROM_STRING="tag_me.utils.parser.split_strip"
+        ):
+            assert f.to_python("ball, apple") == "ball, apple,"
+
     # ..todo:: probably a duplicate of test in test_collections. Review in refactor
     # def test_tags_input_includes_null_tags(self):
     #     null_tags = [
@@ -452,3 +763,12 @@ class TestTagMeCharFieldOtherMethods(TestCase):
             str(type(f.formfield(**kwargs)))
             == "<class 'django.forms.fields.CharField'>"
         )
+
+    def test_admin_widget_class_or_instance_form_class_widget(self):
+        f = TagMeCharField()
+        f.model = UserTag()
+
+        for widget in (AdminTextInputWidget, AdminTextInputWidget()):
+            assert type(f.formfield(widget=widget)) is forms.CharField
+
+        assert type(f.formfield(widget=forms.TextInput)) is TagMeCharField_FORM
@@ -2,12 +2,27 @@
 
 import logging
 import string
+from unittest import mock
 
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError
+from django.test import override_settings
 from hypothesis import given
 from hypothesis import strategies as st
 from hypothesis.extra.django import TestCase
 
-from tests.models import TaggedFieldTestModel
+from tag_me.models import (
+    TagBase,
+    TaggedFieldModel,
+    TagMeSynchronise,
+    UserTag,
+    _ascii_tag,
+    _get_sync_config,
+)
+from tests.models import Post, TaggedFieldTestModel
+
+User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +42,32 @@ class TestTag(TestCase):
         tag = "asdf"
         assert tag in model.slugify(tag)
 
+    def test_tag_slugify_suffix_alphabet(self):
+        model = TaggedFieldTestModel()
+
+        suffix = model.slugify("ZZZ").rsplit("-", 1)[1]
+        assert len(suffix) == 16
+        assert set(suffix) <= set(string.ascii_lowercase + string.digits)
+
+    def test_tag_slugify_truncates_long_tags(self):
+        slug = TaggedFieldTestModel.slugify("a" * 255)
+
+        assert len(slug) == 100
+        assert slug.startswith("a" * 83 + "-")
+
+    def test_long_tag_saved(self):
+        tag = TaggedFieldTestModel.objects.create(tags="long tag " * 28)
+
+        assert len(tag.slug) <= 100
+        assert tag.slug.startswith("long-tag-")
+
+    def test_ascii_tag_folds_composed_and_decomposed_alike(self):
+        assert _ascii_tag("cafe\u0301") == _ascii_tag("caf\u00e9")
+
+    @override_settings(TAGS_STRIP_UNICODE_WHEN_SLUGIFYING=True)
+    def test_tag_slugify_strips_unicode(self):
+        assert TagBase.slugify("caf\u00e9").startswith("cafe-")
+
     @given(
         st_name=st.text(
             # alphabet=st.characters(
@@ -53,3 +94,428 @@ class TestTag(TestCase):
         # assert TagBase.slugify(tag.tags) in tag.slug
 
         assert len(tag.slug) >= 8
+
+
+class TestUserTagSynchronise(TestCase):
+    """Test tags are synchronised across content types."""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="sync_user",
+            password="pw_sync_user",
+            email="sync_user@email.com",
+        )
+        self.post_content = ContentType.objects.get_for_model(Post)
+        self.test_model_content = ContentType.objects.get_for_model(
+            TaggedFieldTestModel
+        )
+        self.post_field = TaggedFieldModel.objects.create(
+            content=self.post_content,
+            model_name="Post",
+            model_verbose_name="post",
+            field_name="synced",
+            field_verbose_name="synced",
+            is_synchronised=True,
+        )
+        self.test_model_field = TaggedFieldModel.objects.create(
+            content=self.test_model_content,
+            model_name="TaggedFieldTestModel",
+            model_verbose_name="Tagged Field Test Model",
+            field_name="synced",
+            field_verbose_name="synced",
+            is_synchronised=True,
+        )
+        self.post_tag = UserTag.objects.create(
+            user=self.user,
+            tagged_field=self.post_field,
+            field_name="synced",
+            tags="",
+        )
+        self.test_model_tag = UserTag.objects.create(
+            user=self.user,
+            tagged_field=self.test_model_field,
+            field_name="synced",
+            tags="",
+        )
+        TagMeSynchronise.objects.update_or_create(
+            name="default",
+            defaults={
+                "synchronise": {
+                    "synced": [
+                        self.post_content.id,
+                        self.test_model_content.id,
+                    ],
+                },
+            },
+        )
+
+    def test_tags_synchronised_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple, ball,"
+            self.post_tag.save()
+
+        assert len(callbacks) == 1
+        self.test_model_tag.refresh_from_db()
+        assert self.test_model_tag.tags == "apple, ball,"
+
+    def test_tags_not_synchronised_before_commit(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            self.post_tag.tags = "apple, ball,"
+            self.post_tag.save()
+
+        self.test_model_tag.refresh_from_db()
+        assert self.test_model_tag.tags == ""
+
+    def test_select_related_save_skips_tagged_field_fetch(self):
+        user_tag = UserTag.objects.select_related("tagged_field").get(
+            id=self.post_tag.id
+        )
+
+        # One UPDATE and one synchronise lookup, no tagged field fetch.
+        with self.captureOnCommitCallbacks(execute=False):
+            with self.assertNumQueries(2):
+                user_tag.tags = "apple, ball,"
+                user_tag.save()
+
+    def test_propagate_tag_single_update(self):
+        with self.assertNumQueries(1):
+            updated = UserTag.objects.propagate_tag(
+                user_id=self.user.id,
+                field_name="synced",
+                tags="apple, ball,",
+                content_ids=[self.test_model_content.id],
+            )
+
+        assert updated == 1
+        self.post_tag.refresh_from_db()
+        self.test_model_tag.refresh_from_db()
+        assert self.post_tag.tags == ""
+        assert self.test_model_tag.tags == "apple, ball,"
+
+    def test_propagate_tag_uses_sync_config(self):
+        updated = UserTag.objects.propagate_tag(
+            user_id=self.user.id,
+            field_name="synced",
+            tags="apple,",
+        )
+
+        assert updated == 2
+
+    def test_propagate_tag_unsynchronised_field(self):
+        updated = UserTag.objects.propagate_tag(
+            user_id=self.user.id,
+            field_name="not_synced",
+            tags="apple,",
+        )
+
+        assert updated == 0
+
+    def test_sync_tags_save_skips_synchronising(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple, ball,"
+            self.post_tag.save(sync_tags_save=True)
+
+        assert callbacks == []
+        self.test_model_tag.refresh_from_db()
+        assert self.test_model_tag.tags == ""
+
+    def test_single_content_type_not_synchronised(self):
+        TagMeSynchronise.objects.filter(name="default").update(
+            synchronise={"synced": [self.post_content.id]},
+        )
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple, ball,"
+            self.post_tag.save()
+
+        assert callbacks == []
+
+    def test_unsynchronised_field_skips_sync_lookup(self):
+        TaggedFieldModel.objects.filter(pk=self.post_field.pk).update(
+            is_synchronised=False
+        )
+        user_tag = UserTag.objects.select_related("tagged_field").get(
+            id=self.post_tag.id
+        )
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertNumQueries(1):
+                user_tag.tags = "apple, ball,"
+                user_tag.save()
+
+        assert callbacks == []
+
+    def test_sync_config_loaded_per_save(self):
+        user_tag = UserTag.objects.select_related("tagged_field").get(
+            id=self.post_tag.id
+        )
+
+        # The UPDATE and the sync config, only its JSON column is loaded.
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            with self.assertNumQueries(2):
+                user_tag.tags = "apple,"
+                user_tag.save()
+
+        assert len(callbacks) == 1
+
+    def test_unchanged_tags_not_synchronised(self):
+        user_tag = UserTag.objects.get(id=self.post_tag.id)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            user_tag.comment = "updated"
+            user_tag.save()
+
+        assert callbacks == []
+
+    def test_tags_synchronised_once_per_change(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple,"
+            self.post_tag.save()
+            self.post_tag.save()
+
+        assert len(callbacks) == 1
+
+    def test_tags_synchronised_on_saved_database(self):
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.post_tag.tags = "apple,"
+            self.post_tag.save()
+
+        assert callbacks[0].func.__self__._db == self.post_tag._state.db
+
+    def test_tags_synchronised_after_refresh_from_db(self):
+        self.post_tag.tags = "apple,"
+        self.post_tag.save()
+        # A sibling's tags propagated from elsewhere.
+        UserTag.objects.filter(id=self.post_tag.id).update(tags="ball,")
+        self.post_tag.refresh_from_db()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple,"
+            self.post_tag.save()
+
+        assert len(callbacks) == 1
+        self.test_model_tag.refresh_from_db()
+        assert self.test_model_tag.tags == "apple,"
+
+    def test_unsaved_tags_not_synchronised(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.tags = "apple,"
+            self.post_tag.comment = "updated"
+            self.post_tag.save(update_fields=["comment"])
+
+        assert callbacks == []
+        # The tags weren't written, so a full save still synchronises them.
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.post_tag.save()
+
+        assert len(callbacks) == 1
+
+    def test_sync_config_not_cached(self):
+        assert _get_sync_config()
+        # As the tags command would from another process.
+        TagMeSynchronise.objects.filter(name="default").update(synchronise={})
+
+        assert _get_sync_config() == {}
+
+
+class TestCheckFieldSyncListLengths(TestCase):
+    """Test sync list checks are logged once per group."""
+
+    def test_logged_once_per_group(self):
+        sync = TagMeSynchronise(
+            synchronise={
+                "empty_1": [],
+                "empty_2": [],
+                "single": [1],
+                "pair": [1, 2],
+                "many": [1, 2, 3],
+            }
+        )
+
+        with self.assertLogs("tag_me.models", "INFO") as logs:
+            sync.check_field_sync_list_lengths()
+
+        assert [record.levelname for record in logs.records] == [
+            "WARNING",
+            "WARNING",
+            "INFO",
+        ]
+        assert "['empty_1', 'empty_2']" in logs.output[0]
+        assert "{'single': [1]}" in logs.output[1]
+
+    def test_nothing_to_synchronise(self):
+        with self.assertLogs("tag_me.models", "INFO") as logs:
+            TagMeSynchronise(synchronise={}).check_field_sync_list_lengths()
+
+        assert len(logs.output) == 1
+
+
+class TestUserTagBulkUpsert(TestCase):
+    """Test user tags are created and updated in bulk."""
+
+    def setUp(self):
+        self.user = User.objects.create(
+            username="bulk_user",
+            password="pw_bulk_user",
+            email="bulk_user@email.com",
+        )
+        self.post_content = ContentType.objects.get_for_model(Post)
+        self.test_model_content = ContentType.objects.get_for_model(
+            TaggedFieldTestModel
+        )
+        self.post_field = TaggedFieldModel.objects.create(
+            content=self.post_content,
+            model_name="Post",
+            model_verbose_name="post",
+            field_name="bulk",
+            field_verbose_name="bulk",
+        )
+        self.test_model_field = TaggedFieldModel.objects.create(
+            content=self.test_model_content,
+            model_name="TaggedFieldTestModel",
+            model_verbose_name="Tagged Field Test Model",
+            field_name="bulk",
+            field_verbose_name="bulk",
+        )
+        self.existing = UserTag.objects.create(
+            user=self.user,
+            tagged_field=self.post_field,
+            field_name="bulk",
+            tags="old,",
+        )
+
+    def _row(self, content, tags):
+        return {
+            "user_id": self.user.id,
+            "content_id": content.id,
+            "field_name": "bulk",
+            "tags": tags,
+        }
+
+    def test_creates_and_updates(self):
+        rows = [
+            self._row(self.post_content, "apple,"),
+            self._row(self.test_model_content, "ball,"),
+        ]
+
+        # Tagged fields, user tags, savepoint, INSERT, UPDATE, release.
+        with self.assertNumQueries(6):
+            created, updated = UserTag.objects.bulk_upsert(rows)
+
+        assert (created, updated) == (1, 1)
+        self.existing.refresh_from_db()
+        assert self.existing.tags == "apple,"
+        user_tag = UserTag.objects.get(
+            user=self.user, tagged_field=self.test_model_field
+        )
+        assert user_tag.tags == "ball,"
+        assert user_tag.model_verbose_name == "Tagged Field Test Model"
+        assert user_tag.slug
+
+    def test_long_tags_slug_fits(self):
+        UserTag.objects.bulk_upsert(
+            [self._row(self.test_model_content, "long tag " * 28)]
+        )
+
+        user_tag = UserTag.objects.get(
+            user=self.user, tagged_field=self.test_model_field
+        )
+        assert len(user_tag.slug) <= 100
+
+    def test_unchanged_and_unknown_rows_skipped(self):
+        rows = [
+            self._row(self.post_content, "old,"),
+            {**self._row(self.post_content, "apple,"), "field_name": "x"},
+        ]
+
+        assert UserTag.objects.bulk_upsert(rows) == (0, 0)
+
+    def test_synchronised_fields_propagated(self):
+        TaggedFieldModel.objects.update(is_synchronised=True)
+        TagMeSynchronise.objects.update_or_create(
+            name="default",
+            defaults={
+                "synchronise": {
+                    "bulk": [
+                        self.post_content.id,
+                        self.test_model_content.id,
+                    ],
+                },
+            },
+        )
+        UserTag.objects.create(
+            user=self.user,
+            tagged_field=self.test_model_field,
+            field_name="bulk",
+            tags="",
+        )
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            UserTag.objects.bulk_upsert(
+                [self._row(self.post_content, "apple,")]
+            )
+
+        assert len(callbacks) == 1
+        assert callbacks[0].keywords["content_ids"] == [
+            self.test_model_content.id
+        ]
+        assert set(
+            UserTag.objects.filter(field_name="bulk").values_list(
+                "tags", flat=True
+            )
+        ) == {"apple,"}
+
+    def test_synchronised_rows_in_one_call_keep_their_tags(self):
+        TaggedFieldModel.objects.update(is_synchronised=True)
+        TagMeSynchronise.objects.update_or_create(
+            name="default",
+            defaults={
+                "synchronise": {
+                    "bulk": [
+                        self.post_content.id,
+                        self.test_model_content.id,
+                    ],
+                },
+            },
+        )
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            UserTag.objects.bulk_upsert(
+                [
+                    self._row(self.post_content, "apple,"),
+                    self._row(self.test_model_content, "ball,"),
+                ]
+            )
+
+        # Every synchronised content type was written, nothing to propagate.
+        assert callbacks == []
+        assert dict(
+            UserTag.objects.filter(field_name="bulk").values_list(
+                "tagged_field__content_id", "tags"
+            )
+        ) == {
+            self.post_content.id: "apple,",
+            self.test_model_content.id: "ball,",
+        }
+
+
+class TestTagBaseSave(TestCase):
+    """Test slug collisions are raised and not silently dropped."""
+
+    def test_slug_generated(self):
+        tag = TaggedFieldTestModel.objects.create(tags="tag")
+
+        assert tag.slug.startswith("tag-")
+
+    def test_slug_collision_raised(self):
+        TaggedFieldTestModel.objects.create(tags="tag", slug="tag-taken")
+        tag = TaggedFieldTestModel(tags="tag")
+
+        with mock.patch.object(
+            TaggedFieldTestModel,
+            "slugify",
+            return_value="tag-taken",
+        ) as slugify:
+            with self.assertRaises(IntegrityError):
+                tag.save()
+
+        assert slugify.call_count == 1